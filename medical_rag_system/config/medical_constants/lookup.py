@@ -0,0 +1,32 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from . import dengue, malaria
+from ._common import normalize_symptom
+
+# Single read-only translation table keyed by (language, normalized phrase),
+# shared by every lookup instead of consulting four per-class dicts. The disease
+# tables already hold normalized keys (see _intern_table). Dengue
+# entries are merged last, so dengue terminology wins for shared phrases.
+_SYMPTOM_TRANSLATIONS: Mapping[Tuple[str, str], str] = MappingProxyType({
+    **{("bengali", k): v for k, v in malaria.BENGALI_SYMPTOMS.items()},
+    **{("hindi", k): v for k, v in malaria.HINDI_SYMPTOMS.items()},
+    **{("bengali", k): v for k, v in dengue.BENGALI_DENGUE_SYMPTOMS.items()},
+    **{("hindi", k): v for k, v in dengue.HINDI_DENGUE_SYMPTOMS.items()}
+})
+
+
+@lru_cache(maxsize=4096)
+def lookup_symptom(language: str, phrase: str) -> Optional[str]:
+    """
+    Translate a Bengali or Hindi symptom phrase to its canonical English term.
+    
+    Args:
+        language: "bengali" or "hindi"
+        phrase: Symptom phrase in that language (normalized before lookup)
+        
+    Returns:
+        Canonical English symptom, or None if the phrase is unknown
+    """
+    return _SYMPTOM_TRANSLATIONS.get((language, normalize_symptom(phrase)))
@@ -0,0 +1,379 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Pattern, Tuple
+
+from ._common import (
+    _FrozenConstants, _SymptomMatching, _build_trie, _by_severity, _compile_alt, _frozen_table,
+    _intern_set, _intern_table, _invert, _leftmost_longest, _scan_trie
+)
+
+# Emergency symptoms that require immediate medical attention
+EMERGENCY_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "unconscious", "unconsciousness", "coma", "seizure", "seizures",
+    "convulsion", "convulsions", "difficulty breathing", "shortness of breath",
+    "severe vomiting", "repeated vomiting", "blood in vomit", "black vomit",
+    "confusion", "delirium", "severe headache", "neck stiffness",
+    "yellowing skin", "jaundice", "dark urine", "bloody urine",
+    "severe weakness", "collapse", "unable to sit", "unable to stand",
+    "high fever"
+})
+
+# Fever at or above these readings is an emergency; numeric temperatures are
+# matched with TEMP_RE and compared, not listed as symptom phrases
+TEMPERATURE_EMERGENCY_C: float = 40.0
+TEMPERATURE_EMERGENCY_F: float = 104.0
+
+# A 2-3 digit reading with an optional unit, e.g. "39.8 C", "103.2°F", "104"
+TEMP_RE: Pattern[str] = re.compile(r"\b(\d{2,3}(?:\.\d+)?)\s*(?:°\s*)?([cf])?\b", re.IGNORECASE)
+
+# Severe symptoms requiring urgent medical care
+SEVERE_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "persistent fever", "severe chills", "rigors", "profuse sweating", "night sweats",
+    "severe muscle pain", "body aches", "joint pain",
+    "persistent headache", "nausea", "vomiting",
+    "diarrhea", "abdominal pain", "stomach pain"
+})
+
+# Early/mild symptoms of malaria
+EARLY_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "fever", "headache", "chills", "muscle aches", "tiredness",
+    "fatigue", "weakness", "loss of appetite", "mild nausea",
+    "body pain", "joint aches", "feeling unwell", "malaise", "sweating"
+})
+
+# Severity level per English symptom (0=early, 1=severe, 2=emergency);
+# later tiers overwrite earlier ones so the most severe level wins
+SEVERITY: Dict[str, int] = {
+    **{s: 0 for s in EARLY_SYMPTOMS},
+    **{s: 1 for s in SEVERE_SYMPTOMS},
+    **{s: 2 for s in EMERGENCY_SYMPTOMS}
+}
+
+# Hindi symptom translations
+HINDI_SYMPTOMS: Dict[str, str] = _intern_table({
+    "बुखार": "fever",
+    "सिर दर्द": "headache",
+    "सिरदर्द": "headache",
+    "कंपकंपी": "chills",
+    "मांसपेशियों में दर्द": "muscle pain",
+    "कमजोरी": "weakness",
+    "थकान": "fatigue",
+    "उल्टी": "vomiting",
+    "दस्त": "diarrhea",
+    "पेट दर्द": "stomach pain",
+    "बेहोशी": "unconsciousness",
+    "दौरे": "seizures",
+    "सांस लেने में तकলीफ": "difficulty breathing",
+    # Additional Hindi symptoms
+    "तेज बुखार": "high fever",
+    "गले में खराश": "sore throat",
+    "खांसी": "cough",
+    "सर चकराना": "dizziness",
+    "भूख न लगना": "loss of appetite",
+    "जी मिचलाना": "nausea",
+    "शरीर में दर्द": "body aches",
+    "जोड़ों में दर्द": "joint pain"
+})
+
+# Bengali symptom translations
+BENGALI_SYMPTOMS: Dict[str, str] = _intern_table({
+    # Basic symptoms
+    "জ্বর": "fever",
+    "মাথাব্যথা": "headache",
+    "মাথা ব্যথা": "headache",
+    "কাঁপুনি": "chills",
+    "ঠান্ডা লাগা": "chills",
+    "পেশীর ব্যথা": "muscle pain",
+    "দুর্বলতা": "weakness",
+    "ক্লান্তি": "fatigue",
+    "বমি": "vomiting",
+    "বমি বমি ভাব": "nausea",
+    "ডায়রিয়া": "diarrhea",
+    "পেটের ব্যথা": "stomach pain",
+    "পেট ব্যথা": "stomach pain",
+
+    # Severe symptoms
+    "অজ্ঞান": "unconsciousness",
+    "খিঁচুনি": "seizures",
+    "শ্বাসকষ্ট": "difficulty breathing",
+    "তীব্র জ্বর": "high fever",
+    "প্রচণ্ড জ্বর": "high fever",
+    "গলা ব্যথা": "sore throat",
+    "কাশি": "cough",
+    "মাথা ঘোরা": "dizziness",
+    "চক্কর": "dizziness",
+    "ক্ষুধামন্দা": "loss of appetite",
+    "খাওয়ার রুচি নেই": "loss of appetite",
+    "শরীর ব্যথা": "body aches",
+    "গা ব্যথা": "body aches",
+    "হাড়ের ব্যথা": "bone pain",
+    "জয়েন্টের ব্যথা": "joint pain",
+    "গলার খুসখুসানি": "throat irritation",
+    "নিঃশ্বাসে কষ্ট": "breathing difficulty",
+
+    # Emergency symptoms
+    "অচেতন": "unconscious",
+    "অচেতন অবস্থা": "unconscious",
+    "জ্ঞান হারানো": "loss of consciousness",
+    "রক্তবমি": "blood in vomit",
+    "কালো বমি": "black vomit",
+    "গুরুতর মাথাব্যথা": "severe headache",
+    "ঘাড় শক্ত": "neck stiffness",
+    "চোখ হলুদ": "yellow eyes",
+    "জন্ডিস": "jaundice",
+    "প্রস্রাবে রক্ত": "blood in urine",
+    "গাঢ় প্রস্রাব": "dark urine",
+
+    # Common expressions
+    "শরীর খারাপ": "feeling unwell",
+    "খারাপ লাগছে": "feeling unwell",
+    "অসুস্থ লাগছে": "feeling sick",
+    "কেমন যেন লাগছে": "feeling strange",
+    "গা গুলানো": "nausea",
+    "পেট খারাপ": "stomach upset"
+})
+
+# Reverse indexes: English symptom -> all local phrases that translate to it
+BENGALI_ENGLISH_TO_LOCAL: Dict[str, Tuple[str, ...]] = _invert(BENGALI_SYMPTOMS)
+
+HINDI_ENGLISH_TO_LOCAL: Dict[str, Tuple[str, ...]] = _invert(HINDI_SYMPTOMS)
+
+# Hindi and Bengali phrases in one table; the two scripts never share a key,
+# so a phrase translates with one probe without knowing its language first
+INDIC_SYMPTOMS: Dict[str, str] = {**HINDI_SYMPTOMS, **BENGALI_SYMPTOMS}
+
+
+def _symptom_phrases() -> FrozenSet[str]:
+    """Every English, Hindi and Bengali malaria symptom phrase."""
+    return EMERGENCY_SYMPTOMS.union(
+        SEVERE_SYMPTOMS, EARLY_SYMPTOMS,
+        HINDI_SYMPTOMS, HINDI_SYMPTOMS.values(),
+        BENGALI_SYMPTOMS, BENGALI_SYMPTOMS.values()
+    )
+
+
+def _emergency_phrases() -> FrozenSet[str]:
+    """Emergency symptoms in English plus their Bengali and Hindi phrases."""
+    return EMERGENCY_SYMPTOMS.union(
+        *(BENGALI_ENGLISH_TO_LOCAL.get(term, ()) for term in EMERGENCY_SYMPTOMS),
+        *(HINDI_ENGLISH_TO_LOCAL.get(term, ()) for term in EMERGENCY_SYMPTOMS)
+    )
+
+
+@lru_cache(maxsize=None)
+def symptom_re() -> Pattern[str]:
+    """
+    Longest-first alternation over every English, Hindi and Bengali malaria
+    symptom phrase, compiled on first use rather than at import.
+    """
+    return _compile_alt(_symptom_phrases())
+
+
+@lru_cache(maxsize=None)
+def emergency_re() -> Pattern[str]:
+    """
+    Longest-first alternation over the emergency symptoms in English, Hindi
+    and Bengali, compiled on first use rather than at import.
+    """
+    return _compile_alt(_emergency_phrases())
+
+
+# Risk factors for malaria
+RISK_FACTORS: FrozenSet[str] = _intern_set({
+    "mosquito bite", "mosquito exposure", "rural area", "forest area",
+    "pregnancy", "pregnant", "travel", "recent travel", "rainy season",
+    "stagnant water", "no bed net", "evening outdoor activity"
+})
+
+
+# Which scan() buckets a phrase belongs to
+_SCAN_SYMPTOM, _SCAN_EMERGENCY, _SCAN_RISK = 1, 2, 4
+
+
+def _scan_payloads() -> Dict[str, Tuple[str, str, int]]:
+    """
+    Tag every phrase of symptom_re(), emergency_re() and RISK_FACTORS for scan().
+    
+    Returns:
+        Lower-cased phrase -> (phrase, canonical_english, bucket flags)
+    """
+    flags: Dict[str, int] = {}
+    for phrases, flag in ((_symptom_phrases(), _SCAN_SYMPTOM), (_emergency_phrases(), _SCAN_EMERGENCY),
+                          (RISK_FACTORS, _SCAN_RISK)):
+        for phrase in phrases:
+            flags[phrase.lower()] = flags.get(phrase.lower(), 0) | flag
+    return {
+        phrase: (phrase, INDIC_SYMPTOMS.get(phrase, phrase), flag)
+        for phrase, flag in flags.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _scan_tries() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the scan tries on first use.
+    
+    Returns:
+        (trie over every English, Hindi and Bengali malaria phrase tagged with
+        its scan() buckets, trie over the emergency phrases only)
+    """
+    payloads = _scan_payloads()
+    return _build_trie(payloads), _build_trie({
+        phrase: phrase for phrase, (_, _, flag) in payloads.items() if flag & _SCAN_EMERGENCY
+    })
+
+
+def scan(text: str) -> Dict[str, List[str]]:
+    """
+    Find malaria symptoms, emergency terms and risk factors in one pass over text.
+    
+    Each bucket keeps the non-overlapping, longest-first matches that the
+    matching alternation (symptom_re(), emergency_re()) would report.
+    
+    Args:
+        text: User or document text in English, Hindi and/or Bengali
+        
+    Returns:
+        Dict with "symptoms" (canonical English terms), "emergency" and "risk"
+        (matched phrases, lower-cased), each in text order
+    """
+    matches = _scan_trie(_scan_tries()[0], text.lower()) if text else []
+    
+    def bucket(flag: int) -> List[Tuple[str, str, int]]:
+        return [payload for _, payload in _leftmost_longest(m for m in matches if m[1][2] & flag)]
+    
+    return {
+        "symptoms": [english for _, english, _ in bucket(_SCAN_SYMPTOM)],
+        "emergency": [phrase for phrase, _, _ in bucket(_SCAN_EMERGENCY)],
+        "risk": [phrase for phrase, _, _ in bucket(_SCAN_RISK)]
+    }
+
+# Medical disclaimer templates
+DISCLAIMERS: Mapping[str, str] = _frozen_table({
+    "general": "This information is for educational purposes only and does not replace professional medical advice. Always consult with a healthcare provider for medical concerns.",
+    "emergency": "⚠️ EMERGENCY: These symptoms may indicate a serious condition. Seek immediate medical attention at the nearest hospital or healthcare facility.",
+    "pregnancy": "⚠️ PREGNANCY ALERT: Malaria during pregnancy can be dangerous for both mother and baby. Seek immediate medical care."
+})
+
+# Bengali disclaimer templates
+BENGALI_DISCLAIMERS: Mapping[str, str] = _frozen_table({
+    "general": "এই তথ্য শুধুমাত্র শিক্ষামূলক উদ্দেশ্যে এবং পেশাদার চিকিৎসা পরামর্শের বিকল্প নয়। স্বাস্থ্য সংক্রান্ত যেকোনো সমস্যার জন্য সর্বদা একজন চিকিৎসকের পরামর্শ নিন।",
+    "emergency": "⚠️ জরুরি অবস্থা: এই লক্ষণগুলি একটি গুরুতর অবস্থার ইঙ্গিত দিতে পারে। অবিলম্বে নিকটস্থ হাসপাতাল বা স্বাস্থ্যসেবা কেন্দ্রে চিকিৎসা সেবা নিন।",
+    "pregnancy": "⚠️ গর্ভাবস্থার সতর্কতা: গর্ভাবস্থায় ম্যালেরিয়া মা ও শিশু উভয়ের জন্য বিপজ্জনক হতে পারে। অবিলম্বে চিকিৎসা সেবা নিন।"
+})
+
+# Hindi disclaimer templates
+HINDI_DISCLAIMERS: Mapping[str, str] = _frozen_table({
+    "general": "यह जानकारी केवल शैक्षिक उद्देश्यों के लिए है और पेशेवर चिकित्सा सलाह का विकल्प नहीं है। स्वास्थ्य संबंधी किसी भी समस्या के लिए हमेशा डॉक्टर से सलाह लें।",
+    "emergency": "⚠️ आपातकाल: ये लक्षण एक गंभीर स्थिति का संकेत हो सकते हैं। तुरंत नजदीकी अस्पताल या स्वास्थ्य केंद्र में चिकित्सा सहायता लें।",
+    "pregnancy": "⚠️ गर्भावस्था चेतावनी: गर्भावस्था में मलेरिया माँ और बच्चे दोनों के लिए खतरनाक हो सकता है। तुरंत चिकित्सा सहायता लें।"
+})
+
+# Disclaimers aligned by Severity for index-based selection
+DISCLAIMERS_BY_SEVERITY: Tuple[Optional[str], ...] = _by_severity(DISCLAIMERS)
+BENGALI_DISCLAIMERS_BY_SEVERITY: Tuple[Optional[str], ...] = _by_severity(BENGALI_DISCLAIMERS)
+HINDI_DISCLAIMERS_BY_SEVERITY: Tuple[Optional[str], ...] = _by_severity(HINDI_DISCLAIMERS)
+
+# The per-language tuples above, indexed by Language, so a disclaimer is
+# DISCLAIMERS_BY_LANGUAGE[language][severity] with no branching on language
+DISCLAIMERS_BY_LANGUAGE: Tuple[Tuple[Optional[str], ...], ...] = (
+    DISCLAIMERS_BY_SEVERITY, HINDI_DISCLAIMERS_BY_SEVERITY, BENGALI_DISCLAIMERS_BY_SEVERITY
+)
+
+
+def disclaimer(language: int, severity: int) -> Optional[str]:
+    """
+    Look up a malaria disclaimer by index.
+    
+    Args:
+        language: Language member (or its int value)
+        severity: Severity member (or its int value)
+        
+    Returns:
+        Disclaimer text, or None if the language has none at that level
+    """
+    return DISCLAIMERS_BY_LANGUAGE[language][severity]
+
+# Confidence thresholds for different actions, in whole percent (0-100).
+# Scores are scaled by 100 once and compared as ints; 1% resolution is enough.
+CONFIDENCE_THRESHOLDS: Mapping[str, int] = _frozen_table({
+    "emergency_detection": 80,
+    "malaria_likelihood": 60,
+    "general_response": 40
+})
+
+# Data sources for attribution
+DATA_SOURCES: Mapping[str, str] = _frozen_table({
+    "medlineplus": "MedlinePlus (U.S. National Library of Medicine)",
+    "who": "World Health Organization",
+    "cdc": "Centers for Disease Control and Prevention",
+    "icmr": "Indian Council of Medical Research",
+    "nhp": "National Health Portal India"
+})
+
+
+# Every tiered English symptom, in a fixed order
+ALL_EN_SYMPTOMS: Tuple[str, ...] = tuple(SEVERITY)
+
+# Phrase tables per language for the symptom matchers; English terms map to themselves
+_PHRASES_BY_LANGUAGE: Dict[str, Mapping[str, str]] = {
+    "bengali": BENGALI_SYMPTOMS,
+    "hindi": HINDI_SYMPTOMS,
+    "english": {symptom: symptom for symptom in ALL_EN_SYMPTOMS}
+}
+
+
+def scan_emergency(text: str) -> List[str]:
+    """
+    Find emergency terms in text, as scan(text)["emergency"] would.
+    
+    Args:
+        text: User or document text in English, Hindi and/or Bengali
+        
+    Returns:
+        Matched emergency phrases, lower-cased, in text order
+    """
+    if not text:
+        return []
+    # The emergency-only trie is much smaller than the full scan() trie
+    emergency_trie = _scan_tries()[1]
+    return [phrase for _, phrase in _leftmost_longest(_scan_trie(emergency_trie, text.lower()))]
+
+
+class MalariaConstants(_SymptomMatching, metaclass=_FrozenConstants):
+    """Medical constants and definitions for malaria detection and triage."""
+    
+    # No instance attributes, so instances cannot shadow the shared constants
+    __slots__ = ()
+    
+    # Aliases of the module-level constants, kept for existing callers
+    EMERGENCY_SYMPTOMS = EMERGENCY_SYMPTOMS
+    SEVERE_SYMPTOMS = SEVERE_SYMPTOMS
+    EARLY_SYMPTOMS = EARLY_SYMPTOMS
+    SEVERITY = SEVERITY
+    ALL_EN_SYMPTOMS = ALL_EN_SYMPTOMS
+    _PHRASES_BY_LANGUAGE = _PHRASES_BY_LANGUAGE
+    HINDI_SYMPTOMS = HINDI_SYMPTOMS
+    BENGALI_SYMPTOMS = BENGALI_SYMPTOMS
+    BENGALI_ENGLISH_TO_LOCAL = BENGALI_ENGLISH_TO_LOCAL
+    HINDI_ENGLISH_TO_LOCAL = HINDI_ENGLISH_TO_LOCAL
+    INDIC_SYMPTOMS = INDIC_SYMPTOMS
+    TEMPERATURE_EMERGENCY_C = TEMPERATURE_EMERGENCY_C
+    TEMPERATURE_EMERGENCY_F = TEMPERATURE_EMERGENCY_F
+    TEMP_RE = TEMP_RE
+    RISK_FACTORS = RISK_FACTORS
+    DISCLAIMERS = DISCLAIMERS
+    BENGALI_DISCLAIMERS = BENGALI_DISCLAIMERS
+    HINDI_DISCLAIMERS = HINDI_DISCLAIMERS
+    DISCLAIMERS_BY_SEVERITY = DISCLAIMERS_BY_SEVERITY
+    BENGALI_DISCLAIMERS_BY_SEVERITY = BENGALI_DISCLAIMERS_BY_SEVERITY
+    HINDI_DISCLAIMERS_BY_SEVERITY = HINDI_DISCLAIMERS_BY_SEVERITY
+    DISCLAIMERS_BY_LANGUAGE = DISCLAIMERS_BY_LANGUAGE
+    CONFIDENCE_THRESHOLDS = CONFIDENCE_THRESHOLDS
+    DATA_SOURCES = DATA_SOURCES
+    
+    symptom_re = staticmethod(symptom_re)
+    emergency_re = staticmethod(emergency_re)
+    disclaimer = staticmethod(disclaimer)
+    scan = staticmethod(scan)
+    scan_emergency = staticmethod(scan_emergency)
@@ -0,0 +1,66 @@
+from ._common import _FrozenConstants
+
+EMERGENCY_RESPONSE = """
+    🚨 EMERGENCY SITUATION DETECTED 🚨
+    
+    Based on the symptoms described, this may be a medical emergency requiring immediate attention.
+    
+    IMMEDIATE ACTION REQUIRED:
+    • Go to the nearest hospital or healthcare center immediately
+    • Call emergency services if available
+    • Do not delay seeking medical care
+    
+    {disclaimer}
+    
+    Source: {sources}
+    """
+
+MALARIA_SUSPECTED_RESPONSE = """
+    ⚠️ POSSIBLE MALARIA SYMPTOMS
+    
+    The symptoms you've described are consistent with malaria, which is common in rural areas.
+    
+    RECOMMENDED ACTIONS:
+    • Visit a healthcare center for malaria testing (blood test)
+    • Seek medical attention within 24 hours
+    • Monitor symptoms closely
+    • Avoid self-medication
+    
+    SYMPTOM SUMMARY:
+    {symptoms}
+    
+    {disclaimer}
+    
+    Source: {sources}
+    Confidence: {confidence}%
+    """
+
+GENERAL_HEALTH_RESPONSE = """
+    HEALTH INFORMATION
+    
+    Based on your symptoms, here's what you should know:
+    
+    {information}
+    
+    RECOMMENDATIONS:
+    • Consult with a healthcare provider for proper evaluation
+    • Monitor your symptoms
+    • Seek medical care if symptoms worsen
+    
+    {disclaimer}
+    
+    Source: {sources}
+    Confidence: {confidence}%
+    """
+
+
+class ResponseTemplates(metaclass=_FrozenConstants):
+    """Templates for generating consistent medical responses."""
+    
+    # No instance attributes, so instances cannot shadow the shared constants
+    __slots__ = ()
+    
+    # Aliases of the module-level templates, kept for existing callers
+    EMERGENCY_RESPONSE = EMERGENCY_RESPONSE
+    MALARIA_SUSPECTED_RESPONSE = MALARIA_SUSPECTED_RESPONSE
+    GENERAL_HEALTH_RESPONSE = GENERAL_HEALTH_RESPONSE
@@ -0,0 +1,217 @@
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
+
+from ._common import (
+    _FrozenConstants, _SymptomMatching, _by_severity, _frozen_table, _intern_set, _intern_table
+)
+
+# Emergency symptoms that require immediate medical attention
+EMERGENCY_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "severe breathing difficulty", "extreme shortness of breath", "chest pain severe",
+    "coughing blood", "blood in sputum", "massive hemoptysis", "breathing failure",
+    "severe weight loss", "extreme fatigue", "high fever persistent",
+    "night sweats profuse", "unconsciousness", "severe chest pain",
+    "difficulty swallowing", "swollen lymph nodes severe"
+})
+
+# Warning signs requiring urgent medical care
+WARNING_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "persistent cough", "cough lasting weeks", "low grade fever", "weight loss gradual",
+    "loss of appetite", "fatigue prolonged", "night sweats", "chest pain mild",
+    "shortness of breath", "sputum production", "hoarse voice",
+    "swollen lymph nodes", "abdominal pain", "bone pain", "back pain"
+})
+
+# Early/typical tuberculosis symptoms
+EARLY_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "cough", "persistent cough", "dry cough", "productive cough",
+    "fever", "low grade fever", "weight loss", "loss of appetite",
+    "fatigue", "weakness", "night sweats", "chest discomfort",
+    "shortness of breath", "tiredness", "malaise", "body aches"
+})
+
+# Severity level per English symptom (0=early, 1=warning, 2=emergency);
+# later tiers overwrite earlier ones so the most severe level wins
+SEVERITY: Dict[str, int] = {
+    **{s: 0 for s in EARLY_SYMPTOMS},
+    **{s: 1 for s in WARNING_SYMPTOMS},
+    **{s: 2 for s in EMERGENCY_SYMPTOMS}
+}
+
+# Bengali tuberculosis symptom translations
+BENGALI_TB_SYMPTOMS: Dict[str, str] = _intern_table({
+    # Basic TB symptoms
+    "কাশি": "cough",
+    "ক্রমাগত কাশি": "persistent cough",
+    "দীর্ঘদিনের কাশি": "persistent cough",
+    "শুকনো কাশি": "dry cough",
+    "কফের সাথে কাশি": "productive cough",
+    "কফ": "sputum",
+    "রক্তের কাশি": "coughing blood",
+    "কফে রক্ত": "blood in sputum",
+    "জ্বর": "fever",
+    "হালকা জ্বর": "low grade fever",
+    "ক্রমাগত জ্বর": "persistent fever",
+    "ওজন কমা": "weight loss",
+    "দ্রুত ওজন কমা": "rapid weight loss",
+    "ক্ষুধামন্দা": "loss of appetite",
+    "খাওয়ার রুচি নেই": "loss of appetite",
+    "দুর্বলতা": "weakness",
+    "ক্লান্তি": "fatigue",
+    "অতিরিক্ত ক্লান্তি": "extreme fatigue",
+    "রাতের ঘাম": "night sweats",
+    "প্রচুর ঘাম": "profuse sweating",
+
+    # Respiratory symptoms
+    "শ্বাসকষ্ট": "shortness of breath",
+    "নিঃশ্বাসে কষ্ট": "breathing difficulty",
+    "তীব্র শ্বাসকষ্ট": "severe breathing difficulty",
+    "বুকে ব্যথা": "chest pain",
+    "বুকের ব্যথা": "chest pain",
+    "তীব্র বুকে ব্যথা": "severe chest pain",
+    "বুকে চাপ": "chest discomfort",
+    "গলার স্বর পরিবর্তন": "hoarse voice",
+    "কন্ঠস্বর বসে যাওয়া": "hoarse voice",
+
+    # Systemic symptoms
+    "গ্রন্থি ফোলা": "swollen lymph nodes",
+    "ঘাড়ের গ্রন্থি ফোলা": "swollen neck lymph nodes",
+    "বগলের গ্রন্থি ফোলা": "swollen armpit lymph nodes",
+    "পেটের ব্যথা": "abdominal pain",
+    "পেট ব্যথা": "abdominal pain",
+    "হাড়ের ব্যথা": "bone pain",
+    "পিঠের ব্যথা": "back pain",
+    "কোমরের ব্যথা": "back pain",
+    "মেরুদণ্ডের ব্যথা": "spinal pain",
+
+    # Severe symptoms
+    "গিলতে কষ্ট": "difficulty swallowing",
+    "খাবার গিলতে পারি না": "difficulty swallowing",
+    "শ্বাস বন্ধ হয়ে আসা": "breathing failure",
+    "চেতনা হারানো": "unconsciousness",
+    "অজ্ঞান": "unconsciousness",
+
+    # Common expressions
+    "যক্ষ্মার লক্ষণ": "tuberculosis symptoms",
+    "টিবির লক্ষণ": "TB symptoms",
+    "ক্ষয়রোগ": "tuberculosis",
+    "যক্ষ্মা": "tuberculosis",
+    "টিবি": "tuberculosis",
+    "শরীর খারাপ": "feeling unwell",
+    "অসুস্থ লাগছে": "feeling sick",
+    "দীর্ঘদিন অসুস্থ": "chronic illness",
+    "কাশি সারছে না": "persistent cough"
+})
+
+# Hindi tuberculosis symptom translations
+HINDI_TB_SYMPTOMS: Dict[str, str] = _intern_table({
+    # Basic TB symptoms
+    "खांसी": "cough",
+    "लगातार खांसी": "persistent cough",
+    "पुरानी खांसी": "chronic cough",
+    "सूखी खांसी": "dry cough",
+    "कफ वाली खांसी": "productive cough",
+    "कफ": "sputum",
+    "खून की खांसी": "coughing blood",
+    "कफ में खून": "blood in sputum",
+    "बुखार": "fever",
+    "हल्का बुखार": "low grade fever",
+    "लगातार बुखार": "persistent fever",
+    "वजन कम होना": "weight loss",
+    "तेजी से वजन कम होना": "rapid weight loss",
+    "भूख न लगना": "loss of appetite",
+    "खाने की इच्छा न होना": "loss of appetite",
+    "कमजोरी": "weakness",
+    "थकान": "fatigue",
+    "अत्यधिक थकान": "extreme fatigue",
+    "रात में पसीना": "night sweats",
+    "अधिक पसीना": "profuse sweating",
+
+    # Respiratory symptoms
+    "सांस फूलना": "shortness of breath",
+    "सांस लेने में तकलीफ": "breathing difficulty",
+    "तेज सांस की तकलीफ": "severe breathing difficulty",
+    "छाती में दर्द": "chest pain",
+    "सीने में दर्द": "chest pain",
+    "तेज छाती का दर्द": "severe chest pain",
+    "सीने में भारीपन": "chest discomfort",
+    "आवाज बैठना": "hoarse voice",
+    "गला बैठना": "hoarse voice",
+
+    # Systemic symptoms
+    "गांठ सूजना": "swollen lymph nodes",
+    "गर्दन में गांठ": "swollen neck lymph nodes",
+    "बगल में गांठ": "swollen armpit lymph nodes",
+    "पेट दर्द": "abdominal pain",
+    "पेट में दर्द": "abdominal pain",
+    "हड्डी में दर्द": "bone pain",
+    "पीठ दर्द": "back pain",
+    "कमर दर्द": "back pain",
+    "रीढ़ की हड्डी में दर्द": "spinal pain",
+
+    # Severe symptoms
+    "निगलने में तकलीफ": "difficulty swallowing",
+    "खाना निगल नहीं सकते": "difficulty swallowing",
+    "सांस रुकना": "breathing failure",
+    "बेहोशी": "unconsciousness",
+    "होश खोना": "unconsciousness",
+
+    # Common expressions
+    "टीबी के लक्षण": "tuberculosis symptoms",
+    "क्षय रोग": "tuberculosis",
+    "तपेदिक": "tuberculosis",
+    "टीबी": "tuberculosis",
+    "यक्ष्मा": "tuberculosis",
+    "तबीयत खराब": "feeling unwell",
+    "बीमार लगना": "feeling sick",
+    "लंबे समय से बीमार": "chronic illness",
+    "खांसी ठीक नहीं हो रही": "persistent cough"
+})
+
+# Tuberculosis disclaimer templates
+BENGALI_TB_DISCLAIMERS: Mapping[str, str] = _frozen_table({
+    "general": "এই তথ্য শুধুমাত্র শিক্ষামূলক উদ্দেশ্যে এবং পেশাদার চিকিৎসা পরামর্শের বিকল্প নয়। যক্ষ্মা সন্দেহ হলে অবিলম্বে চিকিৎসকের পরামর্শ নিন এবং কফ পরীক্ষা করান।",
+    "warning": "⚠️ সতর্কতা: এই লক্ষণগুলি যক্ষ্মার ইঙ্গিত দিতে পারে। যক্ষ্মা একটি সংক্রামক রোগ যা দ্রুত চিকিৎসা প্রয়োজন। অবিলম্বে ডাক্তার দেখান।",
+    "emergency": "🚨 জরুরি অবস্থা: এই লক্ষণগুলি গুরুতর যক্ষ্মা বা জটিলতার ইঙ্গিত দিতে পারে। তাৎক্ষণিক চিকিৎসা সেবা প্রয়োজন এবং অন্যদের থেকে দূরত্ব বজায় রাখুন।"
+})
+
+HINDI_TB_DISCLAIMERS: Mapping[str, str] = _frozen_table({
+    "general": "यह जानकारी केवल शैक्षिक उद्देश्यों के लिए है और पेशेवर चिकित्सा सलाह का विकल्प नहीं है। टीबी का संदेह होने पर तुरंत डॉक्टर से सलाह लें और कफ की जांच कराएं।",
+    "warning": "⚠️ चेतावनी: ये लक्षण टीबी का संकेत हो सकते हैं। टीबी एक संक्रामक बीमारी है जिसका तुरंत इलाज जरूरी है। तत्काल डॉक्टर से मिलें।",
+    "emergency": "🚨 आपातकाल: ये लक्षण गंभीर टीबी या जटिलताओं का संकेत हो सकते हैं। तत्काल चिकित्सा सहायता की आवश्यकता है और दूसरों से दूरी बनाए रखें।"
+})
+
+# Disclaimers aligned by Severity for index-based selection
+BENGALI_TB_DISCLAIMERS_BY_SEVERITY: Tuple[Optional[str], ...] = _by_severity(BENGALI_TB_DISCLAIMERS)
+HINDI_TB_DISCLAIMERS_BY_SEVERITY: Tuple[Optional[str], ...] = _by_severity(HINDI_TB_DISCLAIMERS)
+
+
+# Every tiered English symptom, in a fixed order
+ALL_EN_SYMPTOMS: Tuple[str, ...] = tuple(SEVERITY)
+
+# Phrase tables per language for the symptom matchers; English terms map to themselves
+_PHRASES_BY_LANGUAGE: Dict[str, Mapping[str, str]] = {
+    "bengali": BENGALI_TB_SYMPTOMS,
+    "hindi": HINDI_TB_SYMPTOMS,
+    "english": {symptom: symptom for symptom in ALL_EN_SYMPTOMS}
+}
+
+
+class TuberculosisConstants(_SymptomMatching, metaclass=_FrozenConstants):
+    """Medical constants and definitions for tuberculosis detection and triage."""
+    
+    # No instance attributes, so instances cannot shadow the shared constants
+    __slots__ = ()
+    
+    # Aliases of the module-level constants, kept for existing callers
+    EMERGENCY_SYMPTOMS = EMERGENCY_SYMPTOMS
+    WARNING_SYMPTOMS = WARNING_SYMPTOMS
+    EARLY_SYMPTOMS = EARLY_SYMPTOMS
+    SEVERITY = SEVERITY
+    ALL_EN_SYMPTOMS = ALL_EN_SYMPTOMS
+    _PHRASES_BY_LANGUAGE = _PHRASES_BY_LANGUAGE
+    BENGALI_TB_SYMPTOMS = BENGALI_TB_SYMPTOMS
+    HINDI_TB_SYMPTOMS = HINDI_TB_SYMPTOMS
+    BENGALI_TB_DISCLAIMERS = BENGALI_TB_DISCLAIMERS
+    HINDI_TB_DISCLAIMERS = HINDI_TB_DISCLAIMERS
+    BENGALI_TB_DISCLAIMERS_BY_SEVERITY = BENGALI_TB_DISCLAIMERS_BY_SEVERITY
+    HINDI_TB_DISCLAIMERS_BY_SEVERITY = HINDI_TB_DISCLAIMERS_BY_SEVERITY
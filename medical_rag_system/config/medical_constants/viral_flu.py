@@ -0,0 +1,248 @@
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
+
+from ._common import (
+    _FrozenConstants, _SymptomMatching, _by_severity, _frozen_table, _intern_set, _intern_table
+)
+
+# Emergency symptoms that require immediate medical attention
+EMERGENCY_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "severe breathing difficulty", "extreme shortness of breath", "chest pain severe",
+    "high fever persistent", "fever above 104", "dehydration severe",
+    "confusion", "altered mental state", "difficulty staying awake",
+    "severe vomiting", "unable to keep fluids down", "signs of dehydration",
+    "bluish lips", "bluish face", "difficulty breathing",
+    "persistent chest pain", "worsening symptoms", "pneumonia symptoms"
+})
+
+# Warning signs requiring medical consultation
+WARNING_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "high fever", "fever over 101", "persistent fever", "fever lasting days",
+    "severe headache", "body aches severe", "fatigue severe",
+    "persistent cough", "productive cough", "chest congestion",
+    "sore throat severe", "difficulty swallowing", "ear pain",
+    "nausea", "vomiting", "diarrhea", "stomach upset",
+    "worsening cold symptoms", "sinus pressure severe"
+})
+
+# Typical/common viral flu symptoms
+COMMON_SYMPTOMS: FrozenSet[str] = _intern_set({
+    "fever", "low grade fever", "chills", "body aches", "muscle aches",
+    "headache", "fatigue", "weakness", "runny nose", "stuffy nose",
+    "sneezing", "cough", "dry cough", "sore throat", "scratchy throat",
+    "watery eyes", "mild nausea", "loss of appetite", "tiredness",
+    "congestion", "post nasal drip", "hoarse voice"
+})
+
+# Single symptom -> severity index (0 = common, 1 = warning, 2 = emergency);
+# symptoms listed in several tiers keep the highest one
+SEVERITY: Dict[str, int] = {
+    **{s: 0 for s in COMMON_SYMPTOMS},
+    **{s: 1 for s in WARNING_SYMPTOMS},
+    **{s: 2 for s in EMERGENCY_SYMPTOMS}
+}
+
+# Bengali viral flu symptom translations
+BENGALI_FLU_SYMPTOMS: Dict[str, str] = _intern_table({
+    # Basic flu symptoms
+    "জ্বর": "fever",
+    "হালকা জ্বর": "low grade fever",
+    "তীব্র জ্বর": "high fever",
+    "প্রচণ্ড জ্বর": "high fever",
+    "১০৪ ডিগ্রির উপরে জ্বর": "fever above 104",
+    "কাঁপুনি": "chills",
+    "শীত শীত ভাব": "chills",
+    "শরীর ব্যথা": "body aches",
+    "গা ব্যথা": "body aches",
+    "পেশী ব্যথা": "muscle aches",
+    "মাথাব্যথা": "headache",
+    "মাথা ব্যথা": "headache",
+    "তীব্র মাথাব্যথা": "severe headache",
+    "ক্লান্তি": "fatigue",
+    "দুর্বলতা": "weakness",
+    "অতিরিক্ত ক্লান্তি": "severe fatigue",
+
+    # Respiratory symptoms
+    "কাশি": "cough",
+    "শুকনো কাশি": "dry cough",
+    "কফের কাশি": "productive cough",
+    "ক্রমাগত কাশি": "persistent cough",
+    "নাক দিয়ে পানি পড়া": "runny nose",
+    "নাক বন্ধ": "stuffy nose",
+    "নাক জ্যাম": "nasal congestion",
+    "হাঁচি": "sneezing",
+    "গলা ব্যথা": "sore throat",
+    "গলার খুসখুসানি": "scratchy throat",
+    "তীব্র গলা ব্যথা": "severe sore throat",
+    "গিলতে কষ্ট": "difficulty swallowing",
+    "কন্ঠস্বর বসে যাওয়া": "hoarse voice",
+    "শ্বাসকষ্ট": "breathing difficulty",
+    "তীব্র শ্বাসকষ্ট": "severe breathing difficulty",
+    "বুকে কফ জমা": "chest congestion",
+    "বুকে ব্যথা": "chest pain",
+    "তীব্র বুকে ব্যথা": "severe chest pain",
+
+    # Other symptoms
+    "চোখ দিয়ে পানি পড়া": "watery eyes",
+    "চোখ জ্বালা": "eye irritation",
+    "কানের ব্যথা": "ear pain",
+    "সাইনাসের চাপ": "sinus pressure",
+    "তীব্র সাইনাস চাপ": "severe sinus pressure",
+    "বমি বমি ভাব": "nausea",
+    "বমি": "vomiting",
+    "তীব্র বমি": "severe vomiting",
+    "ডায়রিয়া": "diarrhea",
+    "পেট খারাপ": "stomach upset",
+    "ক্ষুধামন্দা": "loss of appetite",
+    "খাওয়ার রুচি নেই": "loss of appetite",
+
+    # Severe symptoms
+    "পানিশূন্যতা": "dehydration",
+    "তীব্র পানিশূন্যতা": "severe dehydration",
+    "বিভ্রান্তি": "confusion",
+    "মানসিক অবস্থা পরিবর্তন": "altered mental state",
+    "ঘুমিয়ে থাকতে কষ্ট": "difficulty staying awake",
+    "নীল ঠোঁট": "bluish lips",
+    "নীল মুখ": "bluish face",
+    "তরল রাখতে পারছি না": "unable to keep fluids down",
+    "নিউমোনিয়ার লক্ষণ": "pneumonia symptoms",
+    "লক্ষণ খারাপ হচ্ছে": "worsening symptoms",
+
+    # Common expressions
+    "সর্দি-কাশি": "cold and cough",
+    "ভাইরাল ফ্লু": "viral flu",
+    "মৌসুমি জ্বর": "seasonal fever",
+    "ইনফ্লুয়েঞ্জা": "influenza",
+    "ফ্লু": "flu",
+    "সর্দি": "cold",
+    "ঠান্ডা লাগা": "cold symptoms",
+    "শরীর খারাপ": "feeling unwell",
+    "অসুস্থ লাগছে": "feeling sick",
+    "তবিয়ত খারাপ": "not feeling well"
+})
+
+# Hindi viral flu symptom translations
+HINDI_FLU_SYMPTOMS: Dict[str, str] = _intern_table({
+    # Basic flu symptoms
+    "बुखार": "fever",
+    "हल्का बुखार": "low grade fever",
+    "तेज बुखार": "high fever",
+    "तीव्र बुखार": "high fever",
+    "१०४ डिग्री से ऊपर बुखार": "fever above 104",
+    "कंपकंपी": "chills",
+    "ठंड लगना": "chills",
+    "शरीर में दर्द": "body aches",
+    "गा दर्द": "body aches",
+    "मांसपेशियों में दर्द": "muscle aches",
+    "सिर दर्द": "headache",
+    "सिरदर्द": "headache",
+    "तेज सिर दर्द": "severe headache",
+    "थकान": "fatigue",
+    "कमजोरी": "weakness",
+    "अत्यधिक थकान": "severe fatigue",
+
+    # Respiratory symptoms
+    "खांसी": "cough",
+    "सूखी खांसी": "dry cough",
+    "कफ वाली खांसी": "productive cough",
+    "लगातार खांसी": "persistent cough",
+    "नाक बहना": "runny nose",
+    "नाक बंद": "stuffy nose",
+    "नाक जाम": "nasal congestion",
+    "छींक": "sneezing",
+    "गले में दर्द": "sore throat",
+    "गले में खुजली": "scratchy throat",
+    "तेज गले का दर्द": "severe sore throat",
+    "निगलने में तकलीफ": "difficulty swallowing",
+    "आवाज बैठना": "hoarse voice",
+    "सांस लेने में तकलीफ": "breathing difficulty",
+    "तेज सांस की तकलीफ": "severe breathing difficulty",
+    "सीने में कफ": "chest congestion",
+    "छाती में दर्द": "chest pain",
+    "तेज छाती का दर्द": "severe chest pain",
+
+    # Other symptoms
+    "आंखों से पानी आना": "watery eyes",
+    "आंखों में जलन": "eye irritation",
+    "कान में दर्द": "ear pain",
+    "साइनस का दबाव": "sinus pressure",
+    "तेज साइनस दबाव": "severe sinus pressure",
+    "जी मिचलाना": "nausea",
+    "उल्टी": "vomiting",
+    "तेज उल्टी": "severe vomiting",
+    "दस्त": "diarrhea",
+    "पेट खराब": "stomach upset",
+    "भूख न लगना": "loss of appetite",
+    "खाने की इच्छा न होना": "loss of appetite",
+
+    # Severe symptoms
+    "पानी की कमी": "dehydration",
+    "तीव्र निर्जलीकरण": "severe dehydration",
+    "भ्रम": "confusion",
+    "मानसिक स्थिति में बदलाव": "altered mental state",
+    "जागे रहने में कठिनाई": "difficulty staying awake",
+    "नीले होंठ": "bluish lips",
+    "नीला चेहरा": "bluish face",
+    "तरल पदार्थ रोक नहीं पा रहे": "unable to keep fluids down",
+    "निमोनिया के लक्षण": "pneumonia symptoms",
+    "लक्षण बिगड़ रहे हैं": "worsening symptoms",
+
+    # Common expressions
+    "सर्दी-खांसी": "cold and cough",
+    "वायरल फ्लू": "viral flu",
+    "मौसमी बुखार": "seasonal fever",
+    "इन्फ्लुएंजा": "influenza",
+    "फ्लू": "flu",
+    "सर्दी": "cold",
+    "ठंड लगना": "cold symptoms",
+    "तबीयत खराब": "feeling unwell",
+    "बीमार लगना": "feeling sick",
+    "तबियत अच्छी नहीं": "not feeling well"
+})
+
+# Viral flu disclaimer templates
+BENGALI_FLU_DISCLAIMERS: Mapping[str, str] = _frozen_table({
+    "general": "এই তথ্য শুধুমাত্র শিক্ষামূলক উদ্দেশ্যে এবং পেশাদার চিকিৎসা পরামর্শের বিকল্প নয়। ভাইরাল ফ্লু সাধারণত ৭-১০ দিনে ভালো হয়ে যায়। তবে লক্ষণ খারাপ হলে ডাক্তার দেখান।",
+    "warning": "⚠️ সতর্কতা: এই লক্ষণগুলি গুরুতর ভাইরাল সংক্রমণ বা জটিলতার ইঙ্গিত দিতে পারে। চিকিৎসকের পরামর্শ নিন এবং পর্যাপ্ত বিশ্রাম নিন।",
+    "emergency": "🚨 জরুরি অবস্থা: এই লক্ষণগুলি গুরুতর জটিলতার ইঙ্গিত দিতে পারে। তাৎক্ষণিক চিকিৎসা সেবা প্রয়োজন।"
+})
+
+HINDI_FLU_DISCLAIMERS: Mapping[str, str] = _frozen_table({
+    "general": "यह जानकारी केवल शैक्षिक उद्देश्यों के लिए है और पेशेवर चिकित्सा सलाह का विकल्प नहीं है। वायरल फ्लू आमतौर पर 7-10 दिन में ठीक हो जाता है। लेकिन लक्षण बिगड़ने पर डॉक्टर से मिलें।",
+    "warning": "⚠️ चेतावनी: ये लक्षण गंभीर वायरल संक्रमण या जटिलताओं का संकेत हो सकते हैं। डॉक्टर से सलाह लें और पर्याप्त आराम करें।",
+    "emergency": "🚨 आपातकाल: ये लक्षण गंभीर जटिलताओं का संकेत हो सकते हैं। तत्काल चिकित्सा सहायता की आवश्यकता है।"
+})
+
+# Disclaimers aligned by Severity for index-based selection
+BENGALI_FLU_DISCLAIMERS_BY_SEVERITY: Tuple[Optional[str], ...] = _by_severity(BENGALI_FLU_DISCLAIMERS)
+HINDI_FLU_DISCLAIMERS_BY_SEVERITY: Tuple[Optional[str], ...] = _by_severity(HINDI_FLU_DISCLAIMERS)
+
+# Canonical English symptom list, fixed order
+ALL_EN_SYMPTOMS: Tuple[str, ...] = tuple(SEVERITY)
+
+# Phrase tables per language for the symptom matchers; English terms map to themselves
+_PHRASES_BY_LANGUAGE: Dict[str, Mapping[str, str]] = {
+    "bengali": BENGALI_FLU_SYMPTOMS,
+    "hindi": HINDI_FLU_SYMPTOMS,
+    "english": {symptom: symptom for symptom in ALL_EN_SYMPTOMS}
+}
+
+
+class ViralFluConstants(_SymptomMatching, metaclass=_FrozenConstants):
+    """Medical constants and definitions for viral seasonal flu detection and management."""
+    
+    # No instance attributes, so instances cannot shadow the shared constants
+    __slots__ = ()
+    
+    # Aliases of the module-level constants, kept for existing callers
+    EMERGENCY_SYMPTOMS = EMERGENCY_SYMPTOMS
+    WARNING_SYMPTOMS = WARNING_SYMPTOMS
+    COMMON_SYMPTOMS = COMMON_SYMPTOMS
+    SEVERITY = SEVERITY
+    ALL_EN_SYMPTOMS = ALL_EN_SYMPTOMS
+    _PHRASES_BY_LANGUAGE = _PHRASES_BY_LANGUAGE
+    BENGALI_FLU_SYMPTOMS = BENGALI_FLU_SYMPTOMS
+    HINDI_FLU_SYMPTOMS = HINDI_FLU_SYMPTOMS
+    BENGALI_FLU_DISCLAIMERS = BENGALI_FLU_DISCLAIMERS
+    HINDI_FLU_DISCLAIMERS = HINDI_FLU_DISCLAIMERS
+    BENGALI_FLU_DISCLAIMERS_BY_SEVERITY = BENGALI_FLU_DISCLAIMERS_BY_SEVERITY
+    HINDI_FLU_DISCLAIMERS_BY_SEVERITY = HINDI_FLU_DISCLAIMERS_BY_SEVERITY
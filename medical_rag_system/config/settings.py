@@ -1,16 +1,33 @@
 import os
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from pathlib import Path
 
-class Settings:
+# Base paths, as parts relative to the project root
+_PATHS: Dict[str, Tuple[str, ...]] = {
+    "BASE_DIR": (),
+    "DATA_DIR": ("data",),
+    "RAW_DATA_DIR": ("data", "raw"),
+    "PROCESSED_DATA_DIR": ("data", "processed"),
+    "VECTOR_STORE_DIR": ("data", "vector_stores")
+}
+
+class _LazyPaths(type):
+    """Metaclass that builds the base paths on first access instead of at import."""
+    
+    def __getattr__(cls, name: str) -> Any:
+        parts = _PATHS.get(name)
+        if parts is None:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+        path = Path(__file__).parent.parent.joinpath(*parts)
+        setattr(cls, name, path)
+        return path
+
+class Settings(metaclass=_LazyPaths):
     """Configuration settings for the Medical RAG System."""
     
-    # Base paths
-    BASE_DIR = Path(__file__).parent.parent
-    DATA_DIR = BASE_DIR / "data"
-    RAW_DATA_DIR = DATA_DIR / "raw"
-    PROCESSED_DATA_DIR = DATA_DIR / "processed"
-    VECTOR_STORE_DIR = DATA_DIR / "vector_stores"
+    # Base paths (BASE_DIR, DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR,
+    # VECTOR_STORE_DIR) are resolved lazily by _LazyPaths, so callers that only
+    # need scalar settings never build them
     
     # API Configuration
     MEDLINEPLUS_API_URL = "https://wsearch.nlm.nih.gov/ws/query"
@@ -43,9 +60,25 @@ class Settings:
     
     # API Configuration
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+    API_HOST = "0.0.0.0"
+    API_PORT = 8000
+    # Each worker loads its own MedicalRAGService in the lifespan hook, so more
+    # than one is opt-in: set WEB_CONCURRENCY on hosts with memory to spare
+    API_WORKERS = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # Comma-separated origins allowed to call the API; "*" allows any origin
+    # but disables credentialed requests, which the CORS spec forbids with it
+    CORS_ORIGINS = [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()]
+    CORS_METHODS = ["GET", "POST"]
+    
+    def __getattr__(self, name: str) -> Any:
+        """Resolve lazy base paths on instances too."""
+        return getattr(type(self), name)
     
     @classmethod
     def ensure_directories(cls):
         """Ensure all required directories exist."""
+        # Path.mkdir tries mkdir(2) first and only walks up to create DATA_DIR
+        # when the parent is missing, so once DATA_DIR exists (after the first
+        # subdirectory on a fresh install) each remaining call is one syscall
         for dir_path in [cls.RAW_DATA_DIR, cls.PROCESSED_DATA_DIR, cls.VECTOR_STORE_DIR]:
             dir_path.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
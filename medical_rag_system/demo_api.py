@@ -3,8 +3,9 @@ Demo script to showcase FastAPI endpoints for Medical RAG System.
 This script demonstrates the API functionality without requiring a running server.
 """
 
+import io
 import json
-from datetime import datetime
+import sys
 from typing import Dict, Any
 
 # Import our models to test them
@@ -12,9 +13,95 @@ from src.api.models import (
     MedicalQueryRequest, 
     MedicalQueryResponse, 
     HealthCheckResponse,
-    LanguageEnum
+    LanguageEnum,
+    health_timestamp
 )
 
+API_ENDPOINTS = [
+    {
+        "method": "GET",
+        "path": "/",
+        "description": "Root endpoint with API information",
+        "example_response": {
+            "name": "Medical RAG System API",
+            "version": "1.0.0",
+            "description": "AI-powered medical information system for rural healthcare",
+            "docs": "/docs"
+        }
+    },
+    {
+        "method": "GET", 
+        "path": "/health",
+        "description": "Health check endpoint",
+        "example_response": {
+            "status": "healthy",
+            "timestamp": health_timestamp().isoformat(),
+            "service_status": {
+                "medical_service": "operational",
+                "api": "operational"
+            }
+        }
+    },
+    {
+        "method": "POST",
+        "path": "/query",
+        "description": "Process medical queries",
+        "example_request": {
+            "query": "I have fever and headache",
+            "language": "english",
+            "include_sources": True,
+            "max_results": 5
+        },
+        "example_response": {
+            "response_text": "Medical guidance about fever and headache...",
+            "response_type": "symptom_guidance",
+            "confidence": 0.85,
+            "emergency_alert": False,
+            "symptoms": ["fever", "headache"]
+        }
+    },
+    {
+        "method": "POST",
+        "path": "/emergency-check", 
+        "description": "Quick emergency detection",
+        "example_request": {
+            "query": "Patient unconscious"
+        },
+        "example_response": {
+            "emergency_detected": True,
+            "emergency_indicators": ["unconscious"],
+            "confidence": 0.95,
+            "recommendations": ["Seek immediate medical attention"]
+        }
+    },
+    {
+        "method": "GET",
+        "path": "/symptoms/extract",
+        "description": "Extract symptoms from text",
+        "example_params": {
+            "query": "I have fever, chills and body aches"
+        },
+        "example_response": {
+            "symptoms": ["fever", "chills", "body aches"],
+            "query": "I have fever, chills and body aches"
+        }
+    }
+]
+
+
+def _example_input_line(endpoint: Dict[str, Any]) -> str:
+    """Format an endpoint's example request body or query params for printing."""
+    if 'example_request' in endpoint:
+        return f"   📥 Request: {json.dumps(endpoint['example_request'], indent=6)}"
+    if 'example_params' in endpoint:
+        return f"   📥 Params: {json.dumps(endpoint['example_params'], indent=6)}"
+    return ""
+
+
+# The example payloads are fixed, so they are serialized once at import
+# instead of on every demo run
+ENDPOINTS_JSON = [(endpoint, _example_input_line(endpoint)) for endpoint in API_ENDPOINTS]
+
 def demo_request_response_models():
     """Demonstrate request and response model functionality."""
     print("🏥 Medical RAG System FastAPI Demo")
@@ -40,7 +127,7 @@ def demo_request_response_models():
     
     for i, req_data in enumerate(valid_requests, 1):
         try:
-            request = MedicalQueryRequest(**req_data)
+            request = MedicalQueryRequest.model_validate(req_data)
             print(f"   ✅ Request {i}: '{request.query}' (lang: {request.language})")
         except Exception as e:
             print(f"   ❌ Request {i} failed: {e}")
@@ -55,7 +142,7 @@ def demo_request_response_models():
     
     for i, req_data in enumerate(invalid_requests, 1):
         try:
-            request = MedicalQueryRequest(**req_data)
+            request = MedicalQueryRequest.model_validate(req_data)
             print(f"   ❌ Should have failed: {req_data}")
         except Exception as e:
             print(f"   ✅ Validation error {i}: {type(e).__name__}")
@@ -114,7 +201,7 @@ def demo_request_response_models():
     
     for i, resp_data in enumerate(sample_responses, 1):
         try:
-            response = MedicalQueryResponse(**resp_data)
+            response = MedicalQueryResponse.model_validate(resp_data)
             print(f"   ✅ Response {i}: {response.response_type} (confidence: {response.confidence:.2f})")
             if response.emergency_alert:
                 print(f"      🚨 EMERGENCY: {len(response.symptoms)} symptoms detected")
@@ -147,7 +234,7 @@ def demo_request_response_models():
     
     for i, health_data in enumerate(health_responses, 1):
         try:
-            health = HealthCheckResponse(**health_data)
+            health = HealthCheckResponse.model_validate(health_data)
             print(f"   ✅ Health {i}: {health.status} at {health.timestamp}")
             operational_services = sum(1 for status in health.service_status.values() if status == "operational")
             print(f"      📊 {operational_services}/{len(health.service_status)} services operational")
@@ -156,98 +243,26 @@ def demo_request_response_models():
 
 def demo_api_endpoints():
     """Demonstrate what the API endpoints would do."""
-    print("\n4. 🌐 API Endpoints Overview:")
-    
-    endpoints = [
-        {
-            "method": "GET",
-            "path": "/",
-            "description": "Root endpoint with API information",
-            "example_response": {
-                "name": "Medical RAG System API",
-                "version": "1.0.0",
-                "description": "AI-powered medical information system for rural healthcare",
-                "docs": "/docs"
-            }
-        },
-        {
-            "method": "GET", 
-            "path": "/health",
-            "description": "Health check endpoint",
-            "example_response": {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "service_status": {
-                    "medical_service": "operational",
-                    "api": "operational"
-                }
-            }
-        },
-        {
-            "method": "POST",
-            "path": "/query",
-            "description": "Process medical queries",
-            "example_request": {
-                "query": "I have fever and headache",
-                "language": "english",
-                "include_sources": True,
-                "max_results": 5
-            },
-            "example_response": {
-                "response_text": "Medical guidance about fever and headache...",
-                "response_type": "symptom_guidance",
-                "confidence": 0.85,
-                "emergency_alert": False,
-                "symptoms": ["fever", "headache"]
-            }
-        },
-        {
-            "method": "POST",
-            "path": "/emergency-check", 
-            "description": "Quick emergency detection",
-            "example_request": {
-                "query": "Patient unconscious"
-            },
-            "example_response": {
-                "emergency_detected": True,
-                "emergency_indicators": ["unconscious"],
-                "confidence": 0.95,
-                "recommendations": ["Seek immediate medical attention"]
-            }
-        },
-        {
-            "method": "GET",
-            "path": "/symptoms/extract",
-            "description": "Extract symptoms from text",
-            "example_params": {
-                "query": "I have fever, chills and body aches"
-            },
-            "example_response": {
-                "symptoms": ["fever", "chills", "body aches"],
-                "query": "I have fever, chills and body aches"
-            }
-        }
-    ]
+    # Collect the overview in one buffer and write it once
+    buf = io.StringIO()
+    buf.write("\n4. 🌐 API Endpoints Overview:\n")
     
-    for endpoint in endpoints:
-        print(f"\n   {endpoint['method']} {endpoint['path']}")
-        print(f"   📖 {endpoint['description']}")
+    for endpoint, example_input in ENDPOINTS_JSON:
+        buf.write(f"\n   {endpoint['method']} {endpoint['path']}\n   📖 {endpoint['description']}\n")
         
-        if 'example_request' in endpoint:
-            print(f"   📥 Request: {json.dumps(endpoint['example_request'], indent=6)}")
-        elif 'example_params' in endpoint:
-            print(f"   📥 Params: {json.dumps(endpoint['example_params'], indent=6)}")
+        if example_input:
+            buf.write(f"{example_input}\n")
             
         if 'example_response' in endpoint:
             response_preview = str(endpoint['example_response'])
             if len(response_preview) > 100:
                 response_preview = response_preview[:100] + "..."
-            print(f"   📤 Response: {response_preview}")
+            buf.write(f"   📤 Response: {response_preview}\n")
+    
+    sys.stdout.write(buf.getvalue())
 
 def demo_usage_scenarios():
     """Demonstrate typical usage scenarios."""
-    print("\n5. 🎯 Usage Scenarios:")
-    
     scenarios = [
         {
             "name": "Rural Health Worker Query",
@@ -299,13 +314,17 @@ def demo_usage_scenarios():
         }
     ]
     
+    # Collect every scenario in one buffer and write it once
+    buf = io.StringIO()
+    buf.write("\n5. 🎯 Usage Scenarios:\n")
     for i, scenario in enumerate(scenarios, 1):
-        print(f"\n   Scenario {i}: {scenario['name']}")
-        print(f"   📝 {scenario['description']}")
-        print(f"   💬 Query: \"{scenario['query']}\"")
-        print(f"   🔄 Expected Flow:")
-        for step in scenario['expected_flow']:
-            print(f"      {step}")
+        buf.write(f"\n   Scenario {i}: {scenario['name']}\n"
+                  f"   📝 {scenario['description']}\n"
+                  f"   💬 Query: \"{scenario['query']}\"\n"
+                  f"   🔄 Expected Flow:\n")
+        buf.writelines(f"      {step}\n" for step in scenario['expected_flow'])
+    
+    sys.stdout.write(buf.getvalue())
 
 def main():
     """Run the complete demo."""
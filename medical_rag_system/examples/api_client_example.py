@@ -4,31 +4,223 @@ Demonstrates how to interact with the API programmatically.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import json
+import threading
 import time
-from typing import Dict, Any
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+
+# Shared by every POST; bodies are sent pre-encoded as UTF-8 JSON
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request payload to compact UTF-8 JSON.
+    
+    requests' json= escapes every non-ASCII character as \\uXXXX (6 bytes per
+    Hindi or Bengali code point, versus 3 in UTF-8), so bodies are encoded here.
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _reset_delay(value: str) -> float:
+    """
+    Seconds until a rate-limit window resets.
+    
+    Args:
+        value: X-RateLimit-Reset / Retry-After header, either seconds to wait
+            or an epoch timestamp
+            
+    Returns:
+        Seconds to wait (0 if the header cannot be parsed)
+    """
+    try:
+        reset = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    # Large values are absolute epoch times rather than a delay
+    if reset > 1e9:
+        reset -= time.time()
+    return max(reset, 0.0)
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that throttles only when the server reports its limit is spent.
+    
+    After a response with X-RateLimit-Remaining: 0, further requests wait
+    until its X-RateLimit-Reset (or Retry-After) has passed; otherwise they are
+    sent immediately.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+    
+    def send(self, request, **kwargs):
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        
+        response = super().send(request, **kwargs)
+        
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            headers = response.headers
+            wait = _reset_delay(headers.get("X-RateLimit-Reset") or headers.get("Retry-After"))
+            with self._lock:
+                self._resume_at = max(self._resume_at, time.monotonic() + wait)
+        return response
+
+class _PostSafeRetry(Retry):
+    """
+    Retry policy that replays a POST only when the server never handled it.
+    
+    Other methods follow the configured status_forcelist. A POST is retried
+    after a connection error (urllib3 retries those for every method), or
+    after a 429/503 rejection, which arrives before the request runs. It is
+    not retried after a read timeout or a 5xx from a request that may have
+    been processed.
+    """
+    
+    POST_STATUS_FORCELIST = frozenset({429, 503})
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code in self.POST_STATUS_FORCELIST
+        return super().is_retry(method, status_code, has_retry_after)
 
 class MedicalRAGClient:
     """Client for interacting with Medical RAG System API."""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        """Initialize the client with the API base URL."""
+    def __init__(self, base_url: str = "http://localhost:8000", max_workers: int = 10,
+                 timeout: float = 30.0, cache_ttl: float = 600.0, cache_size: int = 1024,
+                 health_ttl: float = 30.0):
+        """
+        Initialize the client with the API base URL.
+        
+        Args:
+            base_url: Base URL of the API server
+            max_workers: Requests allowed in flight at once for batched calls,
+                and pooled connections kept open per host
+            timeout: Seconds to wait for each request before it fails (GETs are then retried)
+            cache_ttl: Seconds an emergency-check or symptom-extraction result is reused
+            cache_size: Most recently used results kept in that cache
+            health_ttl: Seconds a health-check result is reused
+        """
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.health_ttl = health_ttl
+        # (endpoint, query) -> (expiry, result), least recently used first; the
+        # lock keeps it consistent across the executor's threads
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.session = requests.Session()
+        # Keep one pooled keep-alive connection per worker so batched calls reuse
+        # connections instead of reconnecting. Transient failures are replayed up
+        # to 3 times with exponential backoff (0.3s, 0.6s, 1.2s), honouring a
+        # Retry-After header on 429/503. POSTs are left out of the read-error
+        # retries (POST is not in allowed_methods), and _PostSafeRetry limits
+        # their status retries to 429/503, so a query the server may already
+        # have processed is never sent twice. Beyond that, requests are only
+        # held back when the server's rate-limit headers say so
+        adapter = _RateLimitedAdapter(
+            pool_maxsize=max_workers,
+            max_retries=_PostSafeRetry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Calls are I/O-bound, so threads overlap their round trips; the pool
+        # size also caps how many requests are in flight at once
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def submit_each(self, call: Callable[[str], Dict[str, Any]],
+                    queries: Iterable[str]) -> List["Future[Dict[str, Any]]"]:
+        """
+        Start one client call per query without waiting for any of them.
+        
+        Args:
+            call: Bound client method such as self.query_medical
+            queries: Independent queries to send
+            
+        Returns:
+            Futures in the same order as queries
+        """
+        return [self.executor.submit(call, query) for query in queries]
+    
+    def map(self, call: Callable[[str], Dict[str, Any]], queries: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Run one client call per query concurrently.
+        
+        Args:
+            call: Bound client method such as self.query_medical
+            queries: Independent queries to send
+            
+        Returns:
+            Results in the same order as queries; failures come back as
+            {"error": ...} dicts, as from the single-call methods
+        """
+        return [future.result() for future in self.submit_each(call, queries)]
+    
+    def _cached(self, endpoint: str, query: str, fetch: Callable[[], Dict[str, Any]],
+                ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Reuse a fresh result for a deterministic endpoint, or fetch and cache it.
+        
+        Args:
+            endpoint: Endpoint name, part of the cache key
+            query: Query text, part of the cache key
+            fetch: Performs the request when there is no fresh cached result
+            ttl: Seconds the result stays fresh; defaults to cache_ttl
+            
+        Returns:
+            API result; {"error": ...} results are not cached, so the next call retries
+        """
+        key = (endpoint, query)
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                return entry[1]
+        
+        result = fetch()
+        if 'error' not in result:
+            with self._cache_lock:
+                self._cache[key] = (now + (self.cache_ttl if ttl is None else ttl), result)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+    
+    def close(self):
+        """Release the worker threads and pooled connections."""
+        self.executor.shutdown(wait=True)
+        self.session.close()
     
     def health_check(self) -> Dict[str, Any]:
-        """Check if the API is healthy."""
-        try:
-            response = self.session.get(f"{self.base_url}/health")
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            return {"error": str(e), "status": "unhealthy"}
+        """Check if the API is healthy, reusing a result up to health_ttl seconds old."""
+        def fetch() -> Dict[str, Any]:
+            try:
+                response = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
+                response.raise_for_status()
+                return response.json()
+            except requests.RequestException as e:
+                return {"error": str(e), "status": "unhealthy"}
+        
+        return self._cached("health", "", fetch, ttl=self.health_ttl)
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get detailed system status."""
         try:
-            response = self.session.get(f"{self.base_url}/status")
+            response = self.session.get(f"{self.base_url}/status", timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -47,8 +239,9 @@ class MedicalRAGClient:
             
             response = self.session.post(
                 f"{self.base_url}/query",
-                json=payload,
-                headers={"Content-Type": "application/json"}
+                data=_encode_json(payload),
+                headers=_JSON_HEADERS,
+                timeout=self.timeout
             )
             response.raise_for_status()
             return response.json()
@@ -56,30 +249,38 @@ class MedicalRAGClient:
             return {"error": str(e)}
     
     def check_emergency(self, query: str) -> Dict[str, Any]:
-        """Check if a query indicates a medical emergency."""
-        try:
-            payload = {"query": query}
-            response = self.session.post(
-                f"{self.base_url}/emergency-check",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            return {"error": str(e)}
+        """Check if a query indicates a medical emergency (cached per query)."""
+        def fetch() -> Dict[str, Any]:
+            try:
+                payload = {"query": query}
+                response = self.session.post(
+                    f"{self.base_url}/emergency-check",
+                    data=_encode_json(payload),
+                    headers=_JSON_HEADERS,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                return response.json()
+            except requests.RequestException as e:
+                return {"error": str(e)}
+        
+        return self._cached("emergency-check", query, fetch)
     
     def extract_symptoms(self, query: str) -> Dict[str, Any]:
-        """Extract symptoms from a medical query."""
-        try:
-            response = self.session.get(
-                f"{self.base_url}/symptoms/extract",
-                params={"query": query}
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            return {"error": str(e)}
+        """Extract symptoms from a medical query (cached per query)."""
+        def fetch() -> Dict[str, Any]:
+            try:
+                response = self.session.get(
+                    f"{self.base_url}/symptoms/extract",
+                    params={"query": query},
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                return response.json()
+            except requests.RequestException as e:
+                return {"error": str(e)}
+        
+        return self._cached("symptoms/extract", query, fetch)
 
 def demo_api_usage():
     """Demonstrate API usage with example queries."""
@@ -89,6 +290,10 @@ def demo_api_usage():
     # Initialize client
     client = MedicalRAGClient()
     
+    # Health and status are both wanted when healthy, so fetch them together
+    # and drop the status if the server turns out to be unhealthy
+    status_future = client.executor.submit(client.get_system_status)
+    
     # Test health check
     print("\n1. Health Check:")
     health = client.health_check()
@@ -96,18 +301,19 @@ def demo_api_usage():
     
     if health.get('status') != 'healthy':
         print("❌ API is not healthy. Please check the server.")
+        client.close()
         return
     
     # Test system status
     print("\n2. System Status:")
-    status = client.get_system_status()
+    status = status_future.result()
     if 'error' not in status:
         print(f"   System: {status.get('system_status', 'unknown')}")
         components = status.get('components', {})
         for comp, info in components.items():
             print(f"   {comp}: {info.get('status', 'unknown')}")
     
-    # Test medical queries
+    # Test queries for sections 3-5
     test_queries = [
         "I have fever and headache for 2 days",
         "Patient unconscious with high fever",
@@ -115,13 +321,27 @@ def demo_api_usage():
         "What are the symptoms of malaria?",
         "How to prevent mosquito bites?"
     ]
+    emergency_queries = [
+        "Patient unconscious",
+        "Having seizures", 
+        "I have mild headache"
+    ]
+    symptom_queries = [
+        "I have fever, chills, and body aches",
+        "Patient experiencing nausea and vomiting"
+    ]
+    
+    # Every call below is independent: start them all now and wait on each
+    # only when its section prints, so the batches share one round trip
+    query_futures = client.submit_each(client.query_medical, test_queries)
+    emergency_futures = client.submit_each(client.check_emergency, emergency_queries)
+    symptom_futures = client.submit_each(client.extract_symptoms, symptom_queries)
     
+    # Test medical queries
     print("\n3. Medical Query Processing:")
-    for i, query in enumerate(test_queries, 1):
+    for i, (query, future) in enumerate(zip(test_queries, query_futures), 1):
         print(f"\n   Query {i}: '{query}'")
-        
-        # Process the query
-        result = client.query_medical(query)
+        result = future.result()
         
         if 'error' in result:
             print(f"   ❌ Error: {result['error']}")
@@ -138,19 +358,11 @@ def demo_api_usage():
         if len(response_text) > 100:
             response_text = response_text[:100] + "..."
         print(f"   Response: {response_text}")
-        
-        time.sleep(0.5)  # Brief pause between requests
     
     # Test emergency detection
     print("\n4. Emergency Detection:")
-    emergency_queries = [
-        "Patient unconscious",
-        "Having seizures", 
-        "I have mild headache"
-    ]
-    
-    for query in emergency_queries:
-        result = client.check_emergency(query)
+    for query, future in zip(emergency_queries, emergency_futures):
+        result = future.result()
         if 'error' not in result:
             emergency = result.get('emergency_detected', False)
             indicators = result.get('emergency_indicators', [])
@@ -160,39 +372,69 @@ def demo_api_usage():
     
     # Test symptom extraction
     print("\n5. Symptom Extraction:")
-    symptom_queries = [
-        "I have fever, chills, and body aches",
-        "Patient experiencing nausea and vomiting"
-    ]
-    
-    for query in symptom_queries:
-        result = client.extract_symptoms(query)
+    for query, future in zip(symptom_queries, symptom_futures):
+        result = future.result()
         if 'error' not in result:
             symptoms = result.get('symptoms', [])
             print(f"   '{query}' -> {symptoms}")
     
+    client.close()
     print("\n✅ Demo completed!")
 
+def _show_emergency(client: MedicalRAGClient, query: str):
+    """Print the emergency check for query."""
+    result = client.check_emergency(query)
+    if 'error' not in result:
+        emergency = result.get('emergency_detected', False)
+        print(f"🚨 Emergency: {'YES' if emergency else 'NO'}")
+        if result.get('emergency_indicators'):
+            print(f"   Indicators: {', '.join(result['emergency_indicators'])}")
+    else:
+        print(f"❌ Error: {result['error']}")
+
+def _show_symptoms(client: MedicalRAGClient, query: str):
+    """Print the symptoms extracted from query."""
+    result = client.extract_symptoms(query)
+    if 'error' not in result:
+        symptoms = result.get('symptoms', [])
+        print(f"🔍 Symptoms: {symptoms}")
+    else:
+        print(f"❌ Error: {result['error']}")
+
+# Interactive-mode command prefix -> handler for the text after it
+COMMANDS: Dict[str, Callable[[MedicalRAGClient, str], None]] = {
+    "emergency:": _show_emergency,
+    "symptoms:": _show_symptoms,
+}
+
 def interactive_mode():
     """Interactive mode for testing queries."""
-    print("\n🔄 Interactive Mode - Enter your medical queries:")
-    print("Type 'quit' to exit, 'help' for commands")
-    
     client = MedicalRAGClient()
     
-    # Check if API is available
-    health = client.health_check()
-    if health.get('status') != 'healthy':
-        print("❌ API is not available. Please start the server first.")
-        return
+    # Check if API is available in the background while the user types the
+    # first query; its result is only needed before that query is sent
+    health_future = client.executor.submit(client.health_check)
+    
+    print("\n🔄 Interactive Mode - Enter your medical queries:")
+    print("Type 'quit' to exit, 'help' for commands")
     
     while True:
         try:
+            # Report a finished check before prompting, so a down server is
+            # caught before the user types anything
+            if health_future is not None and health_future.done():
+                health = health_future.result()
+                health_future = None
+                if health.get('status') != 'healthy':
+                    print("❌ API is not available. Please start the server first.")
+                    break
+            
             query = input("\n💬 Query: ").strip()
+            lowered = query.lower()
             
-            if query.lower() in ['quit', 'exit', 'q']:
+            if lowered in ['quit', 'exit', 'q']:
                 break
-            elif query.lower() == 'help':
+            elif lowered == 'help':
                 print("Commands:")
                 print("  - Enter any medical query for full processing")
                 print("  - 'emergency: <query>' for emergency check only")
@@ -202,25 +444,20 @@ def interactive_mode():
             elif not query:
                 continue
             
-            # Handle special commands
-            if query.startswith('emergency:'):
-                result = client.check_emergency(query[10:].strip())
-                if 'error' not in result:
-                    emergency = result.get('emergency_detected', False)
-                    print(f"🚨 Emergency: {'YES' if emergency else 'NO'}")
-                    if result.get('emergency_indicators'):
-                        print(f"   Indicators: {', '.join(result['emergency_indicators'])}")
-                else:
-                    print(f"❌ Error: {result['error']}")
-                continue
+            if health_future is not None:
+                health = health_future.result()
+                health_future = None
+                if health.get('status') != 'healthy':
+                    # Keep the session open so the query can be re-entered
+                    # once the server is up
+                    print("❌ API is not available, so this query was not sent. "
+                          "Please start the server and enter it again.")
+                    continue
             
-            elif query.startswith('symptoms:'):
-                result = client.extract_symptoms(query[9:].strip())
-                if 'error' not in result:
-                    symptoms = result.get('symptoms', [])
-                    print(f"🔍 Symptoms: {symptoms}")
-                else:
-                    print(f"❌ Error: {result['error']}")
+            # Handle special commands
+            command = next((prefix for prefix in COMMANDS if lowered.startswith(prefix)), None)
+            if command is not None:
+                COMMANDS[command](client, query[len(command):].strip())
                 continue
             
             # Full query processing
@@ -253,6 +490,7 @@ def interactive_mode():
         except Exception as e:
             print(f"❌ Error: {e}")
     
+    client.close()
     print("\n👋 Goodbye!")
 
 if __name__ == "__main__":
@@ -7,9 +7,13 @@ extract symptoms, detect emergencies, and provide appropriate responses
 in Bengali language.
 """
 
+import io
 import sys
 import os
+from contextlib import redirect_stdout
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,6 +24,111 @@ from src.rag_system.response_generator import MedicalResponseGenerator
 from config.medical_constants import MalariaConstants
 
 
+# Demo inputs, built once at import; dicts are read-only views
+SYMPTOM_QUERIES = (
+    "আমার জ্বর এবং মাথাব্যথা আছে",
+    "তিন দিন ধরে কাঁপুনি এবং শরীর ব্যথা হচ্ছে",
+    "পেট ব্যথা, বমি বমি ভাব এবং দুর্বলতা অনুভব করছি",
+    "শ্বাসকষ্ট এবং বুকে ব্যথা হচ্ছে",
+    "গুরুতর মাথাব্যথা এবং জ্ঞান হারানোর মতো অবস্থা"
+)
+
+QUERY_TEST_CASES = tuple(MappingProxyType(case) for case in (
+    {
+        "query": "আমার দুই দিন ধরে জ্বর এবং কাঁপুনি",
+        "description": "Common fever symptoms"
+    },
+    {
+        "query": "রোগীর অচেতন অবস্থা এবং খিঁচুনি হচ্ছে",
+        "description": "Emergency situation"
+    },
+    {
+        "query": "ম্যালেরিয়া থেকে কীভাবে বাঁচা যায়?",
+        "description": "Prevention inquiry"
+    },
+    {
+        "query": "গর্ভবতী মহিলার জ্বর হলে কী করতে হবে?",
+        "description": "Pregnancy-related query"
+    }
+))
+
+# Disclaimer scenarios for demo_response_generation
+RESPONSE_SCENARIOS = tuple(MappingProxyType(scenario) for scenario in (
+    {
+        "name": "Regular Symptom Query",
+        "query_info": MappingProxyType({
+            'symptoms': ('fever', 'headache'),
+            'query_type': 'symptom_inquiry',
+            'emergency_detected': False,
+            'metadata': MappingProxyType({'language': 'bengali'})
+        }),
+        "response_type": "symptom_guidance"
+    },
+    {
+        "name": "Emergency Situation",
+        "query_info": MappingProxyType({
+            'symptoms': ('unconsciousness', 'seizures'),
+            'query_type': 'emergency',
+            'emergency_detected': True,
+            'emergency_indicators': ('unconsciousness', 'seizures'),
+            'metadata': MappingProxyType({'language': 'bengali'})
+        }),
+        "response_type": "emergency_alert"
+    },
+    {
+        "name": "Pregnancy-related Query",
+        "query_info": MappingProxyType({
+            'symptoms': ('fever',),
+            'query_type': 'symptom_inquiry',
+            'emergency_detected': False,
+            'metadata': MappingProxyType({
+                'language': 'bengali',
+                'special_populations': ('pregnancy',)
+            })
+        }),
+        "response_type": "symptom_guidance"
+    }
+))
+
+# The same scenario (fever and headache) labelled with each language
+COMPARISON_QUERY_INFOS = tuple(
+    (lang_name, MappingProxyType({
+        'symptoms': ('fever', 'headache'),
+        'query_type': 'symptom_inquiry',
+        'emergency_detected': False,
+        'metadata': MappingProxyType({'language': lang_code})
+    }))
+    for lang_code, lang_name in (
+        ('english', 'English'),
+        ('hindi', 'हिंदी (Hindi)'),
+        ('bengali', 'বাংলা (Bengali)')
+    )
+)
+
+SAMPLE_SYMPTOMS = (
+    "জ্বর", "মাথাব্যথা", "কাঁপুনি", "শ্বাসকষ্ট", 
+    "অজ্ঞান", "বমি", "পেট ব্যথা", "দুর্বলতা"
+)
+
+
+# The demos share one instance of each component instead of building their own
+@lru_cache(maxsize=None)
+def get_query_processor() -> MedicalQueryProcessor:
+    """Return the shared query processor."""
+    return MedicalQueryProcessor()
+
+
+def get_data_processor() -> DataProcessor:
+    """Return the shared data processor (the one the query processor wraps)."""
+    return get_query_processor().data_processor
+
+
+@lru_cache(maxsize=None)
+def get_response_generator() -> MedicalResponseGenerator:
+    """Return the shared response generator."""
+    return MedicalResponseGenerator()
+
+
 def print_banner():
     """Print demo banner."""
     print("=" * 80)
@@ -34,17 +143,9 @@ def demo_symptom_extraction():
     print("🔍 Bengali Symptom Extraction Demo")
     print("-" * 50)
     
-    processor = DataProcessor()
+    processor = get_data_processor()
     
-    test_queries = [
-        "আমার জ্বর এবং মাথাব্যথা আছে",
-        "তিন দিন ধরে কাঁপুনি এবং শরীর ব্যথা হচ্ছে",
-        "পেট ব্যথা, বমি বমি ভাব এবং দুর্বলতা অনুভব করছি",
-        "শ্বাসকষ্ট এবং বুকে ব্যথা হচ্ছে",
-        "গুরুতর মাথাব্যথা এবং জ্ঞান হারানোর মতো অবস্থা"
-    ]
-    
-    for query in test_queries:
+    for query in SYMPTOM_QUERIES:
         print(f"\nQuery (Bengali): {query}")
         symptoms = processor.extract_symptoms(query)
         print(f"Extracted Symptoms: {symptoms}")
@@ -62,28 +163,9 @@ def demo_query_processing():
     print("🧠 Bengali Query Processing Demo")
     print("-" * 50)
     
-    processor = MedicalQueryProcessor()
+    processor = get_query_processor()
     
-    test_cases = [
-        {
-            "query": "আমার দুই দিন ধরে জ্বর এবং কাঁপুনি",
-            "description": "Common fever symptoms"
-        },
-        {
-            "query": "রোগীর অচেতন অবস্থা এবং খিঁচুনি হচ্ছে",
-            "description": "Emergency situation"
-        },
-        {
-            "query": "ম্যালেরিয়া থেকে কীভাবে বাঁচা যায়?",
-            "description": "Prevention inquiry"
-        },
-        {
-            "query": "গর্ভবতী মহিলার জ্বর হলে কী করতে হবে?",
-            "description": "Pregnancy-related query"
-        }
-    ]
-    
-    for case in test_cases:
+    for case in QUERY_TEST_CASES:
         print(f"\n📝 Test Case: {case['description']}")
         print(f"Query (Bengali): {case['query']}")
         
@@ -110,48 +192,10 @@ def demo_response_generation():
     print("💬 Bengali Response Generation Demo")
     print("-" * 50)
     
-    response_generator = MedicalResponseGenerator()
+    response_generator = get_response_generator()
     constants = MalariaConstants()
     
-    # Test different response scenarios
-    scenarios = [
-        {
-            "name": "Regular Symptom Query",
-            "query_info": {
-                'symptoms': ['fever', 'headache'],
-                'query_type': 'symptom_inquiry',
-                'emergency_detected': False,
-                'metadata': {'language': 'bengali'}
-            },
-            "response_type": "symptom_guidance"
-        },
-        {
-            "name": "Emergency Situation",
-            "query_info": {
-                'symptoms': ['unconsciousness', 'seizures'],
-                'query_type': 'emergency',
-                'emergency_detected': True,
-                'emergency_indicators': ['unconsciousness', 'seizures'],
-                'metadata': {'language': 'bengali'}
-            },
-            "response_type": "emergency_alert"
-        },
-        {
-            "name": "Pregnancy-related Query",
-            "query_info": {
-                'symptoms': ['fever'],
-                'query_type': 'symptom_inquiry',
-                'emergency_detected': False,
-                'metadata': {
-                    'language': 'bengali',
-                    'special_populations': ['pregnancy']
-                }
-            },
-            "response_type": "symptom_guidance"
-        }
-    ]
-    
-    for scenario in scenarios:
+    for scenario in RESPONSE_SCENARIOS:
         print(f"\n🎯 Scenario: {scenario['name']}")
         print("-" * 30)
         
@@ -172,30 +216,14 @@ def demo_language_comparison():
     print("🌐 Multi-Language Comparison Demo")
     print("-" * 50)
     
-    response_generator = MedicalResponseGenerator()
-    
-    # Same medical scenario in different languages
-    test_scenario = {
-        'symptoms': ['fever', 'headache'],
-        'query_type': 'symptom_inquiry',
-        'emergency_detected': False
-    }
-    
-    languages = [
-        ('english', 'English'),
-        ('hindi', 'हिंदी (Hindi)'),
-        ('bengali', 'বাংলা (Bengali)')
-    ]
+    response_generator = get_response_generator()
     
     print("Comparing disclaimers for the same medical scenario:")
     print("Symptoms: fever, headache")
     print()
     
-    for lang_code, lang_name in languages:
+    for lang_name, query_info in COMPARISON_QUERY_INFOS:
         print(f"📋 {lang_name} Disclaimer:")
-        query_info = test_scenario.copy()
-        query_info['metadata'] = {'language': lang_code}
-        
         disclaimers = response_generator.add_medical_disclaimers(query_info, 'symptom_guidance')
         print(f"   {disclaimers[0]}")
         print()
@@ -211,12 +239,7 @@ def demo_bengali_constants():
     constants = MalariaConstants()
     
     print("Sample Bengali Symptom Translations:")
-    sample_symptoms = [
-        "জ্বর", "মাথাব্যথা", "কাঁপুনি", "শ্বাসকষ্ট", 
-        "অজ্ঞান", "বমি", "পেট ব্যথা", "দুর্বলতা"
-    ]
-    
-    for bengali_symptom in sample_symptoms:
+    for bengali_symptom in SAMPLE_SYMPTOMS:
         if bengali_symptom in constants.BENGALI_SYMPTOMS:
             english_translation = constants.BENGALI_SYMPTOMS[bengali_symptom]
             print(f"   {bengali_symptom} → {english_translation}")
@@ -235,7 +258,7 @@ def interactive_demo():
     print("Type 'quit' or 'বন্ধ' to exit.")
     print()
     
-    processor = MedicalQueryProcessor()
+    processor = get_query_processor()
     
     while True:
         try:
@@ -279,11 +302,17 @@ def main():
     ]
     
     for demo_name, demo_func in demos:
+        # Each section prints into a buffer that is written out in one go,
+        # instead of encoding and writing the Bengali text line by line.
+        # Sections run serially: together they take a few milliseconds of
+        # GIL-bound work, and redirect_stdout swaps the process-wide stdout
+        buf = io.StringIO()
         try:
-            demo_func()
+            with redirect_stdout(buf):
+                demo_func()
         except Exception as e:
-            print(f"Error in {demo_name} demo: {e}")
-            continue
+            buf.write(f"Error in {demo_name} demo: {e}\n")
+        sys.stdout.write(buf.getvalue())
     
     # Ask if user wants interactive demo
     try:
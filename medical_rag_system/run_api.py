@@ -36,16 +36,19 @@ def main():
     # Ensure required directories exist
     Settings.ensure_directories()
     
-    # Start the server
+    # Start the server: auto-reload in debug mode, otherwise worker processes.
+    # loop/http "auto" pick uvloop and httptools when uvicorn[standard] is installed
     try:
         uvicorn.run(
             "src.api.main:app",
-            host="0.0.0.0",
-            port=8000,
+            host=Settings.API_HOST,
+            port=Settings.API_PORT,
             reload=Settings.DEBUG,
+            workers=None if Settings.DEBUG else Settings.API_WORKERS,
             log_level=Settings.LOG_LEVEL.lower(),
             access_log=True,
-            loop="asyncio"
+            loop="auto",
+            http="auto"
         )
     except KeyboardInterrupt:
         logger.info("Server shutdown requested by user")
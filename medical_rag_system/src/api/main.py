@@ -5,7 +5,8 @@ Provides REST API endpoints for medical query processing and response generation
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+import json
 import logging
 from typing import Dict, Any
 from contextlib import asynccontextmanager
@@ -59,34 +60,42 @@ app = FastAPI(
 )
 
 # Add CORS middleware
+# Only the methods the API exposes; credentials only with an explicit origin
+# list, where Starlette also adds Vary: Origin to its responses
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_origins=Settings.CORS_ORIGINS,
+    allow_credentials="*" not in Settings.CORS_ORIGINS,
+    allow_methods=Settings.CORS_METHODS,
     allow_headers=["*"],
 )
 
+# The root payload never changes, so encode it once instead of running it
+# through response validation and JSON encoding on every hit
+_ROOT_BODY = json.dumps({
+    "name": "Medical RAG System API",
+    "version": "1.0.0",
+    "description": "AI-powered medical information system for rural healthcare",
+    "docs": "/docs",
+    "health": "/health"
+}).encode("utf-8")
+
 @app.get("/", response_model=Dict[str, str])
 async def root():
     """Root endpoint with basic API information."""
-    return {
-        "name": "Medical RAG System API",
-        "version": "1.0.0",
-        "description": "AI-powered medical information system for rural healthcare",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health", response_model=HealthCheckResponse)
 async def health_check():
     """Health check endpoint."""
+    # health_check() only inspects in-memory component references (no model or
+    # vector store calls), so it is answered live rather than from a cached
+    # flag that could report a stale state to the load balancer
     try:
         is_healthy = await medical_service.health_check() if medical_service else False
         
         return HealthCheckResponse(
             status="healthy" if is_healthy else "unhealthy",
-            timestamp=None,  # Will be set by the model
             service_status={
                 "medical_service": "operational" if is_healthy else "error",
                 "api": "operational"
@@ -96,7 +105,6 @@ async def health_check():
         logger.error(f"Health check failed: {e}")
         return HealthCheckResponse(
             status="unhealthy",
-            timestamp=None,
             service_status={
                 "medical_service": "error",
                 "api": "operational"
@@ -247,9 +255,12 @@ async def general_exception_handler(request, exc: Exception):
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
+        "src.api.main:app",
+        host=Settings.API_HOST,
+        port=Settings.API_PORT,
+        reload=Settings.DEBUG,
+        workers=None if Settings.DEBUG else Settings.API_WORKERS,
+        log_level=Settings.LOG_LEVEL.lower(),
+        loop="auto",
+        http="auto"
     )
\ No newline at end of file
@@ -6,7 +6,7 @@ Handles medical query processing, emergency detection, and response generation.
 import asyncio
 import logging
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from src.rag_system.query_processor import MedicalQueryProcessor
@@ -172,21 +172,11 @@ class MedicalRAGService:
         try:
             logger.info(f"Processing query: '{query[:50]}...'")
             
-            # Step 1: Process query
-            processed_query = await asyncio.get_event_loop().run_in_executor(
-                None, self.query_processor.process_query, query
-            )
-            
-            # Step 2: Retrieve relevant documents
-            retrieval_context = await asyncio.get_event_loop().run_in_executor(
-                None, self.retrieval_engine.retrieve_relevant_documents, 
-                processed_query, max_results
-            )
-            
-            # Step 3: Generate response
-            retrieval_context['query'] = processed_query
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, self.response_generator.generate_response, retrieval_context
+            # Each step feeds the next (retrieval filters on the symptoms and
+            # emergency flag from step 1), so they cannot run concurrently; run
+            # them in one executor hop to keep the event loop free
+            processed_query, response = await asyncio.get_event_loop().run_in_executor(
+                None, self._run_pipeline, query, max_results
             )
             
             # Add processing time
@@ -208,6 +198,30 @@ class MedicalRAGService:
             logger.error(f"Query processing failed: {e}")
             raise
     
+    def _run_pipeline(self, query: str, max_results: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Run the blocking query, retrieval and generation steps in order.
+        
+        Args:
+            query: Medical query string
+            max_results: Maximum number of results
+            
+        Returns:
+            Tuple of the processed query and the generated response
+        """
+        # Step 1: Process query
+        processed_query = self.query_processor.process_query(query)
+        
+        # Step 2: Retrieve relevant documents
+        retrieval_context = self.retrieval_engine.retrieve_relevant_documents(
+            processed_query, max_results
+        )
+        
+        # Step 3: Generate response
+        retrieval_context['query'] = processed_query
+        response = self.response_generator.generate_response(retrieval_context)
+        return processed_query, response
+    
     async def check_emergency(self, query: str) -> Dict[str, Any]:
         """
         Quick emergency check without full processing.
@@ -4,12 +4,40 @@ Defines the data structures for medical RAG system API.
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Optional, Literal, Tuple
 from datetime import datetime
 from enum import Enum
+import time
+
+# (epoch second, timestamp) most recently handed out by health_timestamp();
+# replaced as one tuple so concurrent readers never see a mismatched pair
+_health_timestamp: Tuple[int, Optional[datetime]] = (0, None)
+
+def health_timestamp() -> datetime:
+    """
+    Current local time truncated to the second, built at most once per second.
+    
+    Load balancers poll /health many times a second; they all share one
+    timestamp object instead of each building (and serializing) a new one.
+    
+    Returns:
+        Naive local datetime with microsecond 0
+    """
+    global _health_timestamp
+    second = int(time.time())
+    cached_second, timestamp = _health_timestamp
+    if cached_second != second or timestamp is None:
+        timestamp = datetime.fromtimestamp(second)
+        _health_timestamp = (second, timestamp)
+    return timestamp
 
 class LanguageEnum(str, Enum):
-    """Supported languages for medical queries."""
+    """
+    Supported languages for medical queries.
+    
+    Pydantic v2 validates this enum with a value lookup inside pydantic-core;
+    it is a small, constant share of request validation, so no custom hashing.
+    """
     ENGLISH = "english"
     HINDI = "hindi"
     BENGALI = "bengali"
@@ -124,8 +152,8 @@ class HealthCheckResponse(BaseModel):
     )
     
     timestamp: datetime = Field(
-        default_factory=datetime.now,
-        description="Timestamp of the health check"
+        default_factory=health_timestamp,
+        description="Timestamp of the health check, to the second"
     )
     
     service_status: Dict[str, str] = Field(
@@ -24,53 +24,16 @@ class DataProcessor:
         self.early_keywords = MalariaConstants.EARLY_SYMPTOMS
         self.hindi_symptoms = MalariaConstants.HINDI_SYMPTOMS
         self.bengali_symptoms = MalariaConstants.BENGALI_SYMPTOMS
-        
-        # Compile regex patterns for efficiency
-        self._compile_symptom_patterns()
     
-    def _compile_symptom_patterns(self):
-        """Compile regex patterns for symptom detection."""
-        # Create pattern for all symptoms (English, Hindi, and Bengali)
-        all_symptoms = (
-            self.emergency_keywords | 
-            self.severe_keywords | 
-            self.early_keywords | 
-            set(self.hindi_symptoms.keys()) |
-            set(self.hindi_symptoms.values()) |
-            set(self.bengali_symptoms.keys()) |
-            set(self.bengali_symptoms.values())
-        )
-        
-        # Sort by length (longest first) to match longer phrases first
-        sorted_symptoms = sorted(all_symptoms, key=len, reverse=True)
-        
-        # Escape special regex characters and create pattern
-        escaped_symptoms = [re.escape(symptom) for symptom in sorted_symptoms]
-        # Use flexible boundaries that work with Unicode characters
-        # Match symptoms even when they appear within larger phrases
-        self.symptom_pattern = re.compile(
-            r'(' + '|'.join(escaped_symptoms) + r')', 
-            re.IGNORECASE | re.UNICODE
-        )
-        
-        # Pattern for emergency indicators (include Bengali and Hindi emergency terms)
-        emergency_terms = set(self.emergency_keywords)
-        
-        # Add Bengali emergency terms
-        for bengali_term, english_term in self.bengali_symptoms.items():
-            if english_term in self.emergency_keywords:
-                emergency_terms.add(bengali_term)
-        
-        # Add Hindi emergency terms  
-        for hindi_term, english_term in self.hindi_symptoms.items():
-            if english_term in self.emergency_keywords:
-                emergency_terms.add(hindi_term)
-        
-        emergency_escaped = [re.escape(symptom) for symptom in sorted(emergency_terms, key=len, reverse=True)]
-        self.emergency_pattern = re.compile(
-            r'(' + '|'.join(emergency_escaped) + r')', 
-            re.IGNORECASE | re.UNICODE
-        )
+    @property
+    def symptom_pattern(self):
+        """All symptoms (English, Hindi and Bengali); compiled once per process, on first use."""
+        return MalariaConstants.symptom_re()
+    
+    @property
+    def emergency_pattern(self):
+        """Emergency indicators, including Bengali and Hindi terms; compiled once per process, on first use."""
+        return MalariaConstants.emergency_re()
     
     def clean_text(self, text: str) -> str:
         """
@@ -126,21 +89,8 @@ class DataProcessor:
         # Clean text first
         cleaned_text = self.clean_text(text)
         
-        # Find all symptom matches
-        matches = self.symptom_pattern.findall(cleaned_text)
-        
-        # Convert to lowercase and deduplicate
-        symptoms = list(set(match.lower() for match in matches))
-        
-        # Translate Hindi and Bengali symptoms to English
-        translated_symptoms = []
-        for symptom in symptoms:
-            if symptom in self.hindi_symptoms:
-                translated_symptoms.append(self.hindi_symptoms[symptom])
-            elif symptom in self.bengali_symptoms:
-                translated_symptoms.append(self.bengali_symptoms[symptom])
-            else:
-                translated_symptoms.append(symptom)
+        # Find all symptom matches, already translated from Hindi and Bengali to English
+        translated_symptoms = MalariaConstants.scan(cleaned_text)["symptoms"]
         
         # Remove duplicates after translation
         unique_symptoms = list(set(translated_symptoms))
@@ -163,25 +113,35 @@ class DataProcessor:
         
         cleaned_text = self.clean_text(text)
         
-        # Find emergency symptom matches
-        matches = self.emergency_pattern.findall(cleaned_text)
+        # Find emergency symptom matches (lower-cased) with the emergency-only trie
+        matches = MalariaConstants.scan_emergency(cleaned_text)
+        
+        return self._with_temperature_emergencies(matches, cleaned_text)
+    
+    def _with_temperature_emergencies(self, matches: List[str], cleaned_text: str) -> List[str]:
+        """
+        Deduplicate emergency phrase matches and add temperature-based emergencies.
         
-        # Convert to lowercase and deduplicate
-        emergency_indicators = list(set(match.lower() for match in matches))
+        Args:
+            matches: Emergency phrases matched in the text
+            cleaned_text: Text the matches were found in, already cleaned
+            
+        Returns:
+            List of emergency indicators found
+        """
+        # Deduplicate
+        emergency_indicators = list(set(matches))
         
         # Check for temperature-based emergencies
-        temp_matches = re.findall(r'(\d+)°?[FC]?', cleaned_text)
-        for temp_str in temp_matches:
-            try:
-                temp = float(temp_str)
-                # High fever indicators (assuming Fahrenheit if no unit specified and >50)
-                if temp > 50:  # Likely Fahrenheit
-                    if temp >= 104:  # 104°F = 40°C
-                        emergency_indicators.append("high fever")
-                elif temp >= 40:  # Celsius
-                    emergency_indicators.append("high fever")
-            except ValueError:
-                continue
+        for temp_str, unit in MalariaConstants.TEMP_RE.findall(cleaned_text):
+            temp = float(temp_str)
+            # Assume Fahrenheit if no unit is given and the reading is above 50
+            if unit.lower() == 'f' or (not unit and temp > 50):
+                threshold = MalariaConstants.TEMPERATURE_EMERGENCY_F
+            else:
+                threshold = MalariaConstants.TEMPERATURE_EMERGENCY_C
+            if temp >= threshold:
+                emergency_indicators.append("high fever")
         
         if emergency_indicators:
             logger.warning(f"Emergency indicators detected: {emergency_indicators}")
@@ -288,9 +248,10 @@ class DataProcessor:
                 'chunks': []
             }
         
-        # Extract symptoms and emergency indicators
-        symptoms = self.extract_symptoms(cleaned_content)
-        emergency_indicators = self.detect_emergency_indicators(cleaned_content)
+        # Extract symptoms and emergency indicators with a single scan
+        matches = MalariaConstants.scan(cleaned_content)
+        symptoms = list(set(matches["symptoms"]))
+        emergency_indicators = self._with_temperature_emergencies(matches["emergency"], cleaned_content)
         
         # Create chunks
         chunks = self.chunk_text(cleaned_content)
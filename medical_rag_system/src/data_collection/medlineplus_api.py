@@ -1,13 +1,46 @@
+import io
 import requests
 import time
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
+from lxml import etree
+from typing import Iterator, List, Dict, Optional
 from urllib.parse import urlencode
 import logging
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+
+def parse_documents(xml_bytes: bytes) -> Iterator[Dict[str, str]]:
+    """
+    Stream the documents of a MedlinePlus XML response one at a time.
+    
+    Each <document> element is freed as soon as it has been read, so peak
+    memory stays proportional to one document rather than the whole response.
+    
+    Args:
+        xml_bytes: Raw XML response body
+        
+    Yields:
+        Dict with title, summary, url, date (empty string when missing) and source
+        
+    Raises:
+        etree.XMLSyntaxError: If the response is not well-formed XML
+    """
+    for _, elem in etree.iterparse(io.BytesIO(xml_bytes), events=('end',), tag='document'):
+        content = elem.find('content')
+        if content is not None:
+            yield {
+                'title': content.findtext('title') or '',
+                'summary': content.findtext('summary') or '',
+                'url': content.findtext('url') or '',
+                'date': content.findtext('date') or '',
+                'source': 'medlineplus'
+            }
+        # Drop the parsed document and any already-processed siblings
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
 class MedlinePlusAPI:
     """
     Client for interacting with MedlinePlus API to retrieve medical information.
@@ -64,9 +97,8 @@ class MedlinePlusAPI:
                 
                 response.raise_for_status()
                 
-                # Parse XML response
-                xml_data = response.text
-                return self._parse_xml_results(xml_data)
+                # Parse the raw bytes, letting the XML declaration pick the encoding
+                return self._parse_xml_results(response.content)
                 
             except requests.exceptions.ConnectionError as e:
                 logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
@@ -111,12 +143,12 @@ class MedlinePlusAPI:
         
         return True
     
-    def _parse_xml_results(self, xml_data: str) -> List[Dict[str, str]]:
+    def _parse_xml_results(self, xml_data: bytes) -> List[Dict[str, str]]:
         """
         Parse MedlinePlus XML API response into standardized format.
         
         Args:
-            xml_data: Raw XML response data
+            xml_data: Raw XML response body, undecoded
             
         Returns:
             List of parsed medical documents
@@ -124,47 +156,22 @@ class MedlinePlusAPI:
         results = []
         
         try:
-            # Parse XML
-            root = ET.fromstring(xml_data)
-            logger.debug(f"Parsed XML root: {root.tag}")
-            
-            # Find all document elements
-            documents = root.findall('.//document')
-            logger.debug(f"Found {len(documents)} documents")
-            
-            for doc in documents:
-                content = doc.find('content')
-                if content is not None:
-                    # Extract fields with fallback to empty string
-                    title_elem = content.find('title')
-                    summary_elem = content.find('summary')
-                    url_elem = content.find('url')
-                    date_elem = content.find('date')
-                    
-                    title = title_elem.text if title_elem is not None and title_elem.text else ''
-                    summary = summary_elem.text if summary_elem is not None and summary_elem.text else ''
-                    url = url_elem.text if url_elem is not None and url_elem.text else ''
-                    date = date_elem.text if date_elem is not None and date_elem.text else ''
-                    
-                    logger.debug(f"Extracted: title='{title}', summary='{summary}'")
-                    
-                    parsed_doc = {
-                        'title': title,
-                        'summary': summary,
-                        'url': url,
-                        'date': date,
-                        'source': 'medlineplus'
-                    }
-                    
-                    # Only include documents with essential information
-                    if parsed_doc['title'] and parsed_doc['summary']:
-                        results.append(parsed_doc)
-                        logger.debug(f"Added document: {parsed_doc['title']}")
-                    else:
-                        logger.debug(f"Skipped document due to missing title or summary")
+            # Stream documents straight from the response bytes (lxml rejects str
+            # input with an encoding declaration, and decoding would be wasted)
+            for parsed_doc in parse_documents(xml_data):
+                logger.debug(f"Extracted: title='{parsed_doc['title']}', summary='{parsed_doc['summary']}'")
+                
+                # Only include documents with essential information
+                if parsed_doc['title'] and parsed_doc['summary']:
+                    results.append(parsed_doc)
+                    logger.debug(f"Added document: {parsed_doc['title']}")
+                else:
+                    logger.debug(f"Skipped document due to missing title or summary")
                 
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             logger.error(f"Error parsing XML response: {e}")
+            # A malformed response yields nothing, even if some documents streamed first
+            results = []
         except Exception as e:
             logger.error(f"Unexpected error parsing search results: {e}")
             
@@ -11,7 +11,7 @@ from typing import Dict, List, Set, Tuple, Optional
 from datetime import datetime
 import logging
 
-from config.medical_constants import DengueConstants
+from config.medical_constants import DengueConstants, Severity, detect_language
 from src.rag_system.query_processor import MedicalQueryProcessor
 
 logger = logging.getLogger(__name__)
@@ -25,24 +25,18 @@ class BengaliDengueChecker:
         
     def detect_language(self, text: str) -> str:
         """Detect if the text is in Bengali language."""
-        bengali_chars = set('অআইঈউঊঋএঐওঔকখগঘঙচছজঝঞটঠডঢণতথদধনপফবভমযরলশষসহড়ঢ়য়ৎং')
-        text_chars = set(text)
-        bengali_count = len(text_chars.intersection(bengali_chars))
-        total_chars = len([c for c in text if c.isalpha()])
-        
-        if total_chars == 0:
-            return "unknown"
-        
-        bengali_ratio = bengali_count / total_chars
-        return "bengali" if bengali_ratio > 0.3 else "other"
+        return detect_language(text, "bengali")
     
     def extract_dengue_symptoms(self, bengali_text: str) -> List[str]:
         """Extract dengue symptoms from Bengali text."""
         symptoms_found = []
-        text_lower = bengali_text.lower()
+        text_lower = self.dengue_constants.normalize(bengali_text)
         
-        for bengali_symptom, english_symptom in self.dengue_constants.BENGALI_DENGUE_SYMPTOMS.items():
+        # Only phrases that fit in the text can occur in it; on query-length
+        # text these substring checks beat a trie scan
+        for bengali_symptom in self.dengue_constants.candidate_phrases("bengali", len(text_lower)):
             if bengali_symptom in text_lower:
+                english_symptom = self.dengue_constants.BENGALI_DENGUE_SYMPTOMS[bengali_symptom]
                 symptoms_found.append(english_symptom)
                 logger.info(f"Found symptom: {bengali_symptom} -> {english_symptom}")
         
@@ -58,14 +52,16 @@ class BengaliDengueChecker:
         warning_symptoms = []
         early_symptoms = []
         
+        severity_of = self.dengue_constants.SEVERITY.get
         for symptom in symptoms:
-            if symptom in self.dengue_constants.EMERGENCY_SYMPTOMS:
+            level = severity_of(symptom, -1)
+            if level == 2:
                 emergency_count += 1
                 emergency_symptoms.append(symptom)
-            elif symptom in self.dengue_constants.WARNING_SYMPTOMS:
+            elif level == 1:
                 warning_count += 1
                 warning_symptoms.append(symptom)
-            elif symptom in self.dengue_constants.EARLY_SYMPTOMS:
+            elif level == 0:
                 early_count += 1
                 early_symptoms.append(symptom)
         
@@ -129,7 +125,7 @@ class BengaliDengueChecker:
 {', '.join(assessment['emergency_symptoms'])}
 
 আত্মীয়স্বজনকে সাথে নিয়ে যান এবং রোগীর অবস্থা নিয়মিত পর্যবেক্ষণ করুন।""",
-            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS["emergency"],
+            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.EMERGENCY],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -150,7 +146,7 @@ class BengaliDengueChecker:
 {', '.join(assessment['warning_symptoms'])}
 
 লক্ষণ আরও খারাপ হলে অবিলম্বে হাসপাতালে যান।""",
-            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS["warning"],
+            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.WARNING],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -175,7 +171,7 @@ class BengaliDengueChecker:
 • ক্রমাগত বমি
 • তীব্র পেটের ব্যথা
 • শ্বাসকষ্ট""",
-            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS["general"],
+            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -198,7 +194,7 @@ class BengaliDengueChecker:
 • তীব্র জ্বর (১০২°F এর উপরে)
 • তীব্র মাথাব্যথা ও চোখের ব্যথা
 • রক্তক্ষরণের কোনো লক্ষণ""",
-            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS["general"],
+            "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
 
@@ -229,7 +225,7 @@ class BengaliDengueChecker:
                     "severity": "unclear",
                     "title": "🤔 লক্ষণ স্পষ্ট নয়",
                     "message": "আপনার বর্ণনা থেকে স্পষ্ট লক্ষণ বুঝতে পারিনি। অনুগ্রহ করে আরও বিস্তারিত বলুন।",
-                    "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS["general"],
+                    "disclaimer": self.dengue_constants.BENGALI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
                     "symptoms": [],
                     "confidence": "0%"
                 }
@@ -268,24 +264,17 @@ class HindiDengueChecker:
     
     def detect_language(self, text: str) -> str:
         """Detect if the text is in Hindi language."""
-        hindi_chars = set('अआइईउऊऋएऐओऔकखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह')
-        text_chars = set(text)
-        hindi_count = len(text_chars.intersection(hindi_chars))
-        total_chars = len([c for c in text if c.isalpha()])
-        
-        if total_chars == 0:
-            return "unknown"
-        
-        hindi_ratio = hindi_count / total_chars
-        return "hindi" if hindi_ratio > 0.3 else "other"
+        return detect_language(text, "hindi")
     
     def extract_dengue_symptoms(self, hindi_text: str) -> List[str]:
         """Extract dengue symptoms from Hindi text."""
         symptoms_found = []
-        text_lower = hindi_text.lower()
+        text_lower = self.dengue_constants.normalize(hindi_text)
         
-        for hindi_symptom, english_symptom in self.dengue_constants.HINDI_DENGUE_SYMPTOMS.items():
+        # Only phrases that fit in the text can occur in it
+        for hindi_symptom in self.dengue_constants.candidate_phrases("hindi", len(text_lower)):
             if hindi_symptom in text_lower:
+                english_symptom = self.dengue_constants.HINDI_DENGUE_SYMPTOMS[hindi_symptom]
                 symptoms_found.append(english_symptom)
                 logger.info(f"Found symptom: {hindi_symptom} -> {english_symptom}")
         
@@ -301,14 +290,16 @@ class HindiDengueChecker:
         warning_symptoms = []
         early_symptoms = []
         
+        severity_of = self.dengue_constants.SEVERITY.get
         for symptom in symptoms:
-            if symptom in self.dengue_constants.EMERGENCY_SYMPTOMS:
+            level = severity_of(symptom, -1)
+            if level == 2:
                 emergency_count += 1
                 emergency_symptoms.append(symptom)
-            elif symptom in self.dengue_constants.WARNING_SYMPTOMS:
+            elif level == 1:
                 warning_count += 1
                 warning_symptoms.append(symptom)
-            elif symptom in self.dengue_constants.EARLY_SYMPTOMS:
+            elif level == 0:
                 early_count += 1
                 early_symptoms.append(symptom)
         
@@ -372,7 +363,7 @@ class HindiDengueChecker:
 {', '.join(assessment['emergency_symptoms'])}
 
 परिवारजनों को साथ लेकर जाएं और मरीज की स्थिति पर लगातार नजर रखें।""",
-            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS["emergency"],
+            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.EMERGENCY],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -393,7 +384,7 @@ class HindiDengueChecker:
 {', '.join(assessment['warning_symptoms'])}
 
 लक्षण और बिगड़ने पर तुरंत अस्पताल जाएं।""",
-            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS["warning"],
+            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.WARNING],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -418,7 +409,7 @@ class HindiDengueChecker:
 • लगातार उल्टी
 • तेज पेट दर्द
 • सांस लेने में तकलीफ""",
-            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS["general"],
+            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -441,7 +432,7 @@ class HindiDengueChecker:
 • तेज बुखार (102°F से ऊपर)
 • तीव्र सिर दर्द और आंखों में दर्द
 • खून बहने के कोई संकेत""",
-            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS["general"],
+            "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
 
@@ -472,7 +463,7 @@ class HindiDengueChecker:
                     "severity": "unclear",
                     "title": "🤔 लक्षण स्पष्ट नहीं",
                     "message": "आपके विवरण से स्पष्ट लक्षण समझ नहीं आए। कृपया और विस्तार से बताएं।",
-                    "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS["general"],
+                    "disclaimer": self.dengue_constants.HINDI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
                     "symptoms": [],
                     "confidence": "0%"
                 }
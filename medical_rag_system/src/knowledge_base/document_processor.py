@@ -247,8 +247,12 @@ class MedicalDocumentProcessor:
                 found_keywords.append(keyword)
         
         # Extract symptom names
-        for symptom in self.malaria_constants.EARLY_SYMPTOMS | self.malaria_constants.SEVERE_SYMPTOMS | self.malaria_constants.EMERGENCY_SYMPTOMS:
-            if symptom.lower() in content_lower:
+        # Constant symptom terms are stored normalized, so only the content is lower-cased.
+        # Per-term `in` checks are kept deliberately: on document-length text they
+        # run an order of magnitude faster than one finditer over the symptom
+        # alternation, and they also report phrases nested inside longer ones
+        for symptom in self.malaria_constants.ALL_EN_SYMPTOMS:
+            if symptom in content_lower:
                 found_keywords.append(symptom)
         
         # Extract key medical terms using regex
@@ -29,6 +29,11 @@ class MedicalQueryProcessor:
             r'\b(blood\s+in\s+vomit|bloody\s+vomit|black\s+vomit)\b'
         ]
         
+        self.urgent_temporal_phrases = (
+            'right now', 'immediately', 'as soon as possible',
+            'can\'t wait', 'getting worse', 'rapidly'
+        )
+        
         self.symptom_patterns = [
             r'\b(have|having|feel|feeling|experience|experiencing)\s+(\w+)\b',
             r'\b(symptoms?|signs?)\b',
@@ -43,7 +48,11 @@ class MedicalQueryProcessor:
         ]
         
         # Compile patterns for efficiency
-        self.compiled_emergency_patterns = [re.compile(p, re.IGNORECASE) for p in self.emergency_patterns]
+        # Emergency patterns share no words, so one alternation finds what the
+        # separate patterns would, in a single pass over the query
+        self.compiled_emergency_pattern = re.compile(
+            '|'.join(f'(?:{p})' for p in self.emergency_patterns), re.IGNORECASE
+        )
         self.compiled_symptom_patterns = [re.compile(p, re.IGNORECASE) for p in self.symptom_patterns]
         self.compiled_duration_patterns = [re.compile(p, re.IGNORECASE) for p in self.duration_patterns]
     
@@ -159,23 +168,17 @@ class MedicalQueryProcessor:
         
         emergency_indicators = []
         
-        # Check for emergency patterns
-        for pattern in self.compiled_emergency_patterns:
-            matches = pattern.findall(query)
-            emergency_indicators.extend(matches)
+        # Check for emergency patterns; the whole match is the indicator, so
+        # "severe pain" comes back as one string rather than a group tuple
+        emergency_indicators.extend(m.group(0) for m in self.compiled_emergency_pattern.finditer(query))
         
         # Use existing emergency detection
         existing_indicators = self.data_processor.detect_emergency_indicators(query)
         emergency_indicators.extend(existing_indicators)
         
         # Check for urgent temporal expressions
-        urgent_temporal = [
-            'right now', 'immediately', 'as soon as possible',
-            'can\'t wait', 'getting worse', 'rapidly'
-        ]
-        
         query_lower = query.lower()
-        for temporal in urgent_temporal:
+        for temporal in self.urgent_temporal_phrases:
             if temporal in query_lower:
                 emergency_indicators.append(temporal)
         
@@ -316,8 +319,9 @@ class MedicalQueryProcessor:
         metadata['severity_indicators'] = [word for word in severity_words if word in query_lower]
         
         # Extract medical keywords
-        medical_terms = self.malaria_constants.EARLY_SYMPTOMS | self.malaria_constants.SEVERE_SYMPTOMS | self.malaria_constants.EMERGENCY_SYMPTOMS
-        metadata['medical_keywords'] = [term for term in medical_terms if term.lower() in query_lower]
+        # Malaria tier symptoms short enough to occur in the query
+        medical_terms = self.malaria_constants.candidate_phrases("english", len(query_lower))
+        metadata['medical_keywords'] = [term for term in medical_terms if term in query_lower]
         
         # Detect special populations
         if 'pregnant' in query_lower or 'pregnancy' in query_lower:
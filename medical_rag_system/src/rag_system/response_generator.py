@@ -2,7 +2,7 @@ from typing import Dict, List, Any, Optional
 import logging
 from datetime import datetime
 
-from config.medical_constants import MalariaConstants, ResponseTemplates
+from config.medical_constants import Language, MalariaConstants, ResponseTemplates, Severity, language_id
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -204,26 +204,22 @@ class MedicalResponseGenerator:
         # Detect query language from metadata
         query_language = query_info.get('metadata', {}).get('language', 'english')
         
-        # Select appropriate disclaimer set based on language
-        if query_language == 'bengali':
-            disclaimer_set = self.malaria_constants.BENGALI_DISCLAIMERS
-        elif query_language == 'hindi':
-            disclaimer_set = self.malaria_constants.HINDI_DISCLAIMERS
-        else:
-            # Default to English for 'english', 'mixed', or undetected languages
-            disclaimer_set = self.malaria_constants.DISCLAIMERS
+        # Disclaimers are looked up by language index; 'mixed' or undetected
+        # languages default to English
+        language = language_id(query_language)
+        disclaimer = self.malaria_constants.disclaimer
         
         # Always include general disclaimer
-        disclaimers.append(disclaimer_set['general'])
+        disclaimers.append(disclaimer(language, Severity.GENERAL))
         
         # Emergency-specific disclaimer
         if response_type == 'emergency_alert':
-            disclaimers.append(disclaimer_set['emergency'])
+            disclaimers.append(disclaimer(language, Severity.EMERGENCY))
         
         # Pregnancy-specific disclaimer
         special_populations = query_info.get('metadata', {}).get('special_populations', [])
         if 'pregnancy' in special_populations:
-            disclaimers.append(disclaimer_set['pregnancy'])
+            disclaimers.append(disclaimer(language, Severity.PREGNANCY))
         
         return disclaimers
     
@@ -580,7 +576,7 @@ class MedicalResponseGenerator:
             'response_type': 'error',
             'confidence': 0.0,
             'sources': [],
-            'disclaimers': [self.malaria_constants.DISCLAIMERS['general']],
+            'disclaimers': [self.malaria_constants.disclaimer(Language.ENGLISH, Severity.GENERAL)],
             'recommendations': ["Consult with a qualified healthcare provider"],
             'emergency_alert': False,
             'generated_at': datetime.now().isoformat(),
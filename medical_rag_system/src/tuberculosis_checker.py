@@ -11,7 +11,7 @@ from typing import Dict, List, Set, Tuple, Optional
 from datetime import datetime
 import logging
 
-from config.medical_constants import TuberculosisConstants
+from config.medical_constants import TuberculosisConstants, Severity, detect_language
 from src.rag_system.query_processor import MedicalQueryProcessor
 
 logger = logging.getLogger(__name__)
@@ -25,24 +25,18 @@ class BengaliTuberculosisChecker:
         
     def detect_language(self, text: str) -> str:
         """Detect if the text is in Bengali language."""
-        bengali_chars = set('অআইঈউঊঋএঐওঔকখগঘঙচছজঝঞটঠডঢণতথদধনপফবভমযরলশষসহড়ঢ়য়ৎং')
-        text_chars = set(text)
-        bengali_count = len(text_chars.intersection(bengali_chars))
-        total_chars = len([c for c in text if c.isalpha()])
-        
-        if total_chars == 0:
-            return "unknown"
-        
-        bengali_ratio = bengali_count / total_chars
-        return "bengali" if bengali_ratio > 0.3 else "other"
+        return detect_language(text, "bengali")
     
     def extract_tb_symptoms(self, bengali_text: str) -> List[str]:
         """Extract tuberculosis symptoms from Bengali text."""
         symptoms_found = []
-        text_lower = bengali_text.lower()
+        text_lower = self.tb_constants.normalize(bengali_text)
         
-        for bengali_symptom, english_symptom in self.tb_constants.BENGALI_TB_SYMPTOMS.items():
+        # Only phrases that fit in the text can occur in it; on query-length
+        # text these substring checks beat a trie scan
+        for bengali_symptom in self.tb_constants.candidate_phrases("bengali", len(text_lower)):
             if bengali_symptom in text_lower:
+                english_symptom = self.tb_constants.BENGALI_TB_SYMPTOMS[bengali_symptom]
                 symptoms_found.append(english_symptom)
                 logger.info(f"Found TB symptom: {bengali_symptom} -> {english_symptom}")
         
@@ -58,14 +52,16 @@ class BengaliTuberculosisChecker:
         warning_symptoms = []
         early_symptoms = []
         
+        severity_of = self.tb_constants.SEVERITY.get
         for symptom in symptoms:
-            if symptom in self.tb_constants.EMERGENCY_SYMPTOMS:
+            level = severity_of(symptom, -1)
+            if level == 2:
                 emergency_count += 1
                 emergency_symptoms.append(symptom)
-            elif symptom in self.tb_constants.WARNING_SYMPTOMS:
+            elif level == 1:
                 warning_count += 1
                 warning_symptoms.append(symptom)
-            elif symptom in self.tb_constants.EARLY_SYMPTOMS:
+            elif level == 0:
                 early_count += 1
                 early_symptoms.append(symptom)
         
@@ -134,7 +130,7 @@ class BengaliTuberculosisChecker:
 {', '.join(assessment['emergency_symptoms'])}
 
 যক্ষ্মা একটি সংক্রামক রোগ তাই অন্যদের সুরক্ষার জন্য সতর্কতা অবলম্বন করুন।""",
-            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS["emergency"],
+            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS_BY_SEVERITY[Severity.EMERGENCY],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -158,7 +154,7 @@ class BengaliTuberculosisChecker:
 • কাশির সময় মুখ ঢেকে রাখুন
 • পর্যাপ্ত বায়ু চলাচলযুক্ত জায়গায় থাকুন
 • অন্যদের কাছ থেকে দূরত্ব বজায় রাখুন""",
-            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS["warning"],
+            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS_BY_SEVERITY[Severity.WARNING],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -182,7 +178,7 @@ class BengaliTuberculosisChecker:
 • যক্ষ্মা নিশ্চিত না হওয়া পর্যন্ত সতর্কতা অবলম্বন করুন
 • পুষ্টিকর খাবার খান এবং পর্যাপ্ত বিশ্রাম নিন
 • ধূমপান ও মদ্যপান এড়িয়ে চলুন""",
-            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS["warning"],
+            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS_BY_SEVERITY[Severity.WARNING],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -205,7 +201,7 @@ class BengaliTuberculosisChecker:
 • কাশি ৩ সপ্তাহের বেশি থাকলে অবশ্যই ডাক্তার দেখান
 • ওজন কমতে থাকলে সতর্ক হন
 • রাতের ঘাম বাড়লে চিকিৎসা নিন""",
-            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS["general"],
+            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -229,7 +225,7 @@ class BengaliTuberculosisChecker:
 • দ্রুত ওজন কমা
 • তীব্র রাতের ঘাম
 • শ্বাসকষ্ট""",
-            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS["general"],
+            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -253,7 +249,7 @@ class BengaliTuberculosisChecker:
 • নিয়মিত ব্যায়াম করুন
 • ধূমপান ত্যাগ করুন
 • ভালো বায়ু চলাচলযুক্ত পরিবেশে থাকুন""",
-            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS["general"],
+            "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
 
@@ -284,7 +280,7 @@ class BengaliTuberculosisChecker:
                     "severity": "unclear",
                     "title": "🤔 লক্ষণ স্পষ্ট নয়",
                     "message": "আপনার বর্ণনা থেকে স্পষ্ট লক্ষণ বুঝতে পারিনি। অনুগ্রহ করে আরও বিস্তারিত বলুন।",
-                    "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS["general"],
+                    "disclaimer": self.tb_constants.BENGALI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
                     "symptoms": [],
                     "confidence": "0%"
                 }
@@ -323,24 +319,17 @@ class HindiTuberculosisChecker:
     
     def detect_language(self, text: str) -> str:
         """Detect if the text is in Hindi language."""
-        hindi_chars = set('अआइईउऊऋएऐओऔकखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह')
-        text_chars = set(text)
-        hindi_count = len(text_chars.intersection(hindi_chars))
-        total_chars = len([c for c in text if c.isalpha()])
-        
-        if total_chars == 0:
-            return "unknown"
-        
-        hindi_ratio = hindi_count / total_chars
-        return "hindi" if hindi_ratio > 0.3 else "other"
+        return detect_language(text, "hindi")
     
     def extract_tb_symptoms(self, hindi_text: str) -> List[str]:
         """Extract tuberculosis symptoms from Hindi text."""
         symptoms_found = []
-        text_lower = hindi_text.lower()
+        text_lower = self.tb_constants.normalize(hindi_text)
         
-        for hindi_symptom, english_symptom in self.tb_constants.HINDI_TB_SYMPTOMS.items():
+        # Only phrases that fit in the text can occur in it
+        for hindi_symptom in self.tb_constants.candidate_phrases("hindi", len(text_lower)):
             if hindi_symptom in text_lower:
+                english_symptom = self.tb_constants.HINDI_TB_SYMPTOMS[hindi_symptom]
                 symptoms_found.append(english_symptom)
                 logger.info(f"Found TB symptom: {hindi_symptom} -> {english_symptom}")
         
@@ -356,14 +345,16 @@ class HindiTuberculosisChecker:
         warning_symptoms = []
         early_symptoms = []
         
+        severity_of = self.tb_constants.SEVERITY.get
         for symptom in symptoms:
-            if symptom in self.tb_constants.EMERGENCY_SYMPTOMS:
+            level = severity_of(symptom, -1)
+            if level == 2:
                 emergency_count += 1
                 emergency_symptoms.append(symptom)
-            elif symptom in self.tb_constants.WARNING_SYMPTOMS:
+            elif level == 1:
                 warning_count += 1
                 warning_symptoms.append(symptom)
-            elif symptom in self.tb_constants.EARLY_SYMPTOMS:
+            elif level == 0:
                 early_count += 1
                 early_symptoms.append(symptom)
         
@@ -432,7 +423,7 @@ class HindiTuberculosisChecker:
 {', '.join(assessment['emergency_symptoms'])}
 
 टीबी एक संक्रामक बीमारी है इसलिए दूसरों की सुरक्षा के लिए सावधानी बरतें।""",
-            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS["emergency"],
+            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS_BY_SEVERITY[Severity.EMERGENCY],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -456,7 +447,7 @@ class HindiTuberculosisChecker:
 • खांसते समय मुंह ढकें
 • पर्याप्त हवा आने-जाने वाली जगह रहें
 • दूसरों से दूरी बनाए रखें""",
-            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS["warning"],
+            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS_BY_SEVERITY[Severity.WARNING],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -480,7 +471,7 @@ class HindiTuberculosisChecker:
 • टीबी की पुष्टि न होने तक सतर्कता बरतें
 • पौष्टिक भोजन लें और पर्याप्त आराम करें
 • धूम्रपान और शराब से बचें""",
-            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS["warning"],
+            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS_BY_SEVERITY[Severity.WARNING],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -503,7 +494,7 @@ class HindiTuberculosisChecker:
 • खांसी 3 सप्ताह से ज्यादा हो तो डॉक्टर दिखाएं
 • वजन कम हो रहा हो तो सचेत रहें
 • रात में पसीना बढ़े तो इलाज लें""",
-            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS["general"],
+            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -527,7 +518,7 @@ class HindiTuberculosisChecker:
 • तेजी से वजन कम होना
 • तीव्र रात का पसीना
 • सांस फूलना""",
-            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS["general"],
+            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
     
@@ -551,7 +542,7 @@ class HindiTuberculosisChecker:
 • नियमित व्यायाम करें
 • धूम्रपान छोड़ें
 • अच्छी हवा वाले माहौल में रहें""",
-            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS["general"],
+            "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
             "confidence": f"{assessment['confidence']*100:.0f}%"
         }
 
@@ -582,7 +573,7 @@ class HindiTuberculosisChecker:
                     "severity": "unclear",
                     "title": "🤔 लक्षण स्पष्ट नहीं",
                     "message": "आपके विवरण से स्पष्ट लक्षण समझ नहीं आए। कृपया और विस्तार से बताएं।",
-                    "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS["general"],
+                    "disclaimer": self.tb_constants.HINDI_TB_DISCLAIMERS_BY_SEVERITY[Severity.GENERAL],
                     "symptoms": [],
                     "confidence": "0%"
                 }
@@ -234,7 +234,18 @@ class TestFastAPIEndpoints:
         response = client.options("/")
         # CORS middleware should add headers
         assert response.status_code in [200, 405]  # OPTIONS might not be implemented for all endpoints
-    
+
+    def test_cors_preflight_allows_only_exposed_methods(self, client):
+        """Test CORS preflight allows POST and rejects methods the API does not expose."""
+        headers = {"Origin": "http://example.org", "Access-Control-Request-Method": "POST"}
+        response = client.options("/query", headers=headers)
+        assert response.status_code == 200
+        assert "POST" in response.headers["access-control-allow-methods"]
+
+        headers["Access-Control-Request-Method"] = "DELETE"
+        response = client.options("/query", headers=headers)
+        assert response.status_code == 400
+
     def test_request_validation(self, client, mock_medical_service):
         """Test request validation with invalid data types."""
         # Test with non-string query
@@ -282,4 +293,21 @@ class TestFastAPIEndpoints:
         assert isinstance(data["emergency_alert"], bool)
         assert isinstance(data["symptoms"], list)
         assert isinstance(data["recommendations"], list)
-        assert isinstance(data["disclaimers"], list)
\ No newline at end of file
+        assert isinstance(data["disclaimers"], list)
+
+class TestHealthTimestamp:
+    """Test cases for the per-second health check timestamp."""
+    
+    def test_reused_within_a_second(self):
+        """Test calls in the same second share one second-granular timestamp."""
+        from src.api.models import HealthCheckResponse, health_timestamp
+        
+        with patch('src.api.models.time.time', return_value=1700000000.25):
+            first = health_timestamp()
+            health = HealthCheckResponse(status="healthy", service_status={})
+        
+        assert first.microsecond == 0
+        assert health.timestamp is first
+        
+        with patch('src.api.models.time.time', return_value=1700000001.5):
+            assert health_timestamp() > first
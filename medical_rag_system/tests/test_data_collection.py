@@ -1,7 +1,7 @@
 import pytest
 import requests
 from unittest.mock import Mock, patch, MagicMock
-from src.data_collection.medlineplus_api import MedlinePlusAPI
+from src.data_collection.medlineplus_api import MedlinePlusAPI, parse_documents
 from src.data_collection.data_processor import DataProcessor
 
 class TestMedlinePlusAPI:
@@ -52,7 +52,7 @@ class TestMedlinePlusAPI:
         # Red: Write failing test first
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = """<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
 <nlmSearchResult>
   <list>
     <document>
@@ -91,6 +91,33 @@ class TestMedlinePlusAPI:
             call_args = mock_session_get.call_args
             assert "malaria" in call_args[1]["params"]["term"]
     
+    def test_parse_xml_skips_incomplete_and_malformed(self, api_client):
+        """Test documents without title or summary are skipped and bad XML yields no results."""
+        xml_data = b"""<?xml version="1.0" encoding="UTF-8"?>
+<nlmSearchResult><list>
+  <document><content><title>Malaria</title><summary>Fever and chills.</summary></content></document>
+  <document><content><title></title><summary>No title here.</summary></content></document>
+  <document><content><summary>Missing title.</summary></content></document>
+</list></nlmSearchResult>"""
+        
+        results = api_client._parse_xml_results(xml_data)
+        
+        assert [doc["title"] for doc in results] == ["Malaria"]
+        assert results[0]["url"] == ""
+        assert api_client._parse_xml_results(b"<nlmSearchResult><list>") == []
+    
+    def test_parse_documents_streams_one_at_a_time(self):
+        """Test documents are yielded lazily and truncated responses are rejected."""
+        xml_bytes = ("<r><list>" + "".join(
+            f"<document><content><title>T{i}</title><summary>S</summary></content></document>"
+            for i in range(3)) + "</list></r>").encode()
+        documents = parse_documents(xml_bytes)
+        
+        assert next(documents)["title"] == "T0"
+        assert len(list(documents)) == 2
+        truncated = xml_bytes[:-len(b"</list></r>")]
+        assert MedlinePlusAPI()._parse_xml_results(truncated) == []
+    
     @patch('src.data_collection.medlineplus_api.requests.get')
     def test_search_with_network_error(self, mock_get, api_client):
         """Test handling of network errors with retry logic."""
@@ -118,7 +145,7 @@ class TestMedlinePlusAPI:
         """Test handling of empty search results."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = """<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
 <nlmSearchResult>
   <list></list>
   <count>0</count>
@@ -149,7 +176,7 @@ class TestMedlinePlusAPI:
         """Test that malaria search returns required fields."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = """<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = b"""<?xml version="1.0" encoding="UTF-8"?>
 <nlmSearchResult>
   <list>
     <document>
@@ -239,6 +266,13 @@ class TestDataProcessor:
         for indicator in expected_emergency:
             assert any(indicator in e.lower() for e in emergency_indicators), f"Should detect: {indicator}"
     
+    def test_detect_emergency_temperature_readings(self, processor):
+        """Test numeric fever readings are compared against the thresholds."""
+        assert "high fever" in processor.detect_emergency_indicators("temperature 40.2 C")
+        assert "high fever" in processor.detect_emergency_indicators("fever 104.5°F")
+        assert processor.detect_emergency_indicators("fever 103.2°F since morning") == []
+        assert processor.detect_emergency_indicators("fever since 2024, 39.8 C today") == []
+    
     def test_chunk_text_proper_size(self, processor, sample_medical_text):
         """Test text chunking produces properly sized chunks."""
         chunks = processor.chunk_text(sample_medical_text)
@@ -301,4 +335,13 @@ class TestDataProcessor:
         # Check symptoms and emergency indicators extracted
         assert len(processed["symptoms"]) > 0
         assert len(processed["emergency_indicators"]) > 0
-        assert len(processed["chunks"]) > 0
\ No newline at end of file
+        assert len(processed["chunks"]) > 0
+    
+    def test_process_document_matches_separate_extraction(self, processor):
+        """Test the single-scan document path agrees with the per-call methods."""
+        content = "High fever 104°F with chills; রোগীর জ্বর এবং খিঁচুনি, बेहोशी"
+        processed = processor.process_document({"title": "Mixed", "content": content})
+        
+        assert sorted(processed["symptoms"]) == sorted(processor.extract_symptoms(content))
+        assert sorted(processed["emergency_indicators"]) == sorted(
+            processor.detect_emergency_indicators(content))
\ No newline at end of file
@@ -0,0 +1,453 @@
+"""
+Test the precomputed lookup structures in the medical constants module.
+"""
+
+import subprocess
+import unittest
+import unicodedata
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.medical_constants import (
+    DengueConstants, Language, MalariaConstants, ResponseTemplates, Severity,
+    TuberculosisConstants, ViralFluConstants, detect_language, language_id, lookup_symptom,
+    normalize_symptom, script_language
+)
+from config.medical_constants import dengue, malaria, templates
+from config.medical_constants._common import (
+    _BENGALI_SCRIPT_RE, _DEVANAGARI_SCRIPT_RE, _VECTORIZED_SCRIPT_MIN_LENGTH,
+    _build_trie, _count_scripts_vectorized, _intern_set, _normalize_phrase, _scan_trie
+)
+
+
+class TestSymptomTrie(unittest.TestCase):
+    """Test the Aho-Corasick phrase trie."""
+
+    def test_failure_links_find_every_phrase(self):
+        """Phrases hidden behind a failed longer match are found, in start order."""
+        trie = _build_trie({"abcd": "long", "bc": "mid", "c": "short", "ab": "prefix"})
+        self.assertEqual(_scan_trie(trie, "xabcx"), [
+            ((1, 3), "prefix"), ((2, 4), "mid"), ((3, 4), "short")
+        ])
+        self.assertEqual(_scan_trie(trie, "abcd")[0], ((0, 2), "prefix"))
+        self.assertIn(((0, 4), "long"), _scan_trie(trie, "abcd"))
+
+
+class TestNormalizedKeys(unittest.TestCase):
+    """Test that the translation tables are keyed by normalized phrases."""
+
+    def test_table_keys_are_normalized(self):
+        """Every translation key is already in normalized form."""
+        for table in (MalariaConstants.BENGALI_SYMPTOMS, DengueConstants.HINDI_DENGUE_SYMPTOMS):
+            for phrase in table:
+                self.assertEqual(_normalize_phrase(phrase), phrase)
+
+    def test_decomposed_input_hits_normalized_key(self):
+        """NFD input with stray whitespace resolves once normalized."""
+        user_text = "  " + unicodedata.normalize("NFD", "মাথা  ব্যথা") + " "
+        self.assertEqual(MalariaConstants.BENGALI_SYMPTOMS[_normalize_phrase(user_text)],
+                         "headache")
+
+
+class TestFrozenVocabularies(unittest.TestCase):
+    """Test that the symptom vocabularies are immutable and interned."""
+
+    def test_symptom_sets_are_frozen(self):
+        """Tier sets cannot be mutated at runtime."""
+        for symptoms in (MalariaConstants.EMERGENCY_SYMPTOMS, MalariaConstants.SEVERE_SYMPTOMS,
+                         MalariaConstants.EARLY_SYMPTOMS, DengueConstants.WARNING_SYMPTOMS):
+            self.assertIsInstance(symptoms, frozenset)
+
+    def test_terms_are_interned(self):
+        """Set members are the interned copies of their strings."""
+        for term in MalariaConstants.EMERGENCY_SYMPTOMS:
+            self.assertIs(term, sys.intern(term))
+
+
+class TestSeverityIndex(unittest.TestCase):
+    """Test the precomputed symptom severity lookup."""
+
+    def test_every_tier_symptom_is_indexed(self):
+        """Each tier symptom maps to the level of its most severe tier."""
+        for constants, middle in ((DengueConstants, DengueConstants.WARNING_SYMPTOMS),
+                                  (TuberculosisConstants, TuberculosisConstants.WARNING_SYMPTOMS),
+                                  (MalariaConstants, MalariaConstants.SEVERE_SYMPTOMS)):
+            for symptom in constants.EMERGENCY_SYMPTOMS:
+                self.assertEqual(constants.SEVERITY[symptom], 2)
+            for symptom in middle - constants.EMERGENCY_SYMPTOMS:
+                self.assertEqual(constants.SEVERITY[symptom], 1)
+            for symptom in constants.EARLY_SYMPTOMS - middle - constants.EMERGENCY_SYMPTOMS:
+                self.assertEqual(constants.SEVERITY[symptom], 0)
+
+    def test_unknown_symptom(self):
+        """Symptoms outside every tier are not indexed."""
+        self.assertEqual(DengueConstants.SEVERITY.get("hiccups", -1), -1)
+
+
+class TestReadOnlyTables(unittest.TestCase):
+    """Test that disclaimer and attribution tables are read-only."""
+
+    def test_tables_reject_assignment(self):
+        """Shared lookup tables cannot be modified by callers."""
+        for table in (MalariaConstants.DISCLAIMERS, MalariaConstants.DATA_SOURCES,
+                      MalariaConstants.CONFIDENCE_THRESHOLDS,
+                      DengueConstants.BENGALI_DENGUE_DISCLAIMERS):
+            with self.assertRaises(TypeError):
+                table["general"] = "overridden"
+
+    def test_tables_keep_dict_lookups(self):
+        """Read access behaves exactly like the original dicts."""
+        self.assertIn("emergency", MalariaConstants.HINDI_DISCLAIMERS)
+        self.assertEqual(MalariaConstants.DATA_SOURCES.get("who"), "World Health Organization")
+        self.assertEqual(MalariaConstants.CONFIDENCE_THRESHOLDS["general_response"], 40)
+
+    def test_confidence_thresholds_are_whole_percentages(self):
+        """Thresholds are ints in 0-100 so scores compare without float math."""
+        for name, threshold in MalariaConstants.CONFIDENCE_THRESHOLDS.items():
+            self.assertIsInstance(threshold, int, name)
+            self.assertTrue(0 <= threshold <= 100, name)
+
+    def test_table_strings_are_interned(self):
+        """Keys and text values of the read-only tables are interned."""
+        for key, value in MalariaConstants.DATA_SOURCES.items():
+            self.assertIs(key, sys.intern(key))
+            self.assertIs(value, sys.intern(value))
+
+
+class TestSymptomLookup(unittest.TestCase):
+    """Test the combined language-keyed translation table."""
+
+    def test_lookup_by_language(self):
+        """Phrases resolve through the table for their own language."""
+        self.assertEqual(lookup_symptom("bengali", "মাথা ব্যথা"), "headache")
+        self.assertEqual(lookup_symptom("hindi", "बुखार"), "fever")
+
+    def test_lookup_normalizes_input(self):
+        """Decomposed input with extra whitespace still matches."""
+        phrase = " " + unicodedata.normalize("NFD", "মাথা  ব্যথা")
+        self.assertEqual(lookup_symptom("bengali", phrase), "headache")
+
+    def test_lookup_wrong_language_or_unknown(self):
+        """Unknown phrases and mismatched languages return None."""
+        self.assertIsNone(lookup_symptom("hindi", "মাথা ব্যথা"))
+        self.assertIsNone(lookup_symptom("bengali", "hiccups"))
+
+
+class TestCachedHelpers(unittest.TestCase):
+    """Test the memoized normalization and translation helpers."""
+
+    def test_normalize_symptom_matches_uncached(self):
+        """Cached normalization returns the same result as the raw helper."""
+        text = "  Severe   HEADACHE "
+        self.assertEqual(normalize_symptom(text), _normalize_phrase(text))
+
+    def test_repeated_lookups_hit_cache(self):
+        """Repeated phrases are served from the cache."""
+        lookup_symptom.cache_clear()
+        lookup_symptom("hindi", "बुखार")
+        lookup_symptom("hindi", "बुखार")
+        self.assertEqual(lookup_symptom.cache_info().hits, 1)
+
+
+class TestReverseIndex(unittest.TestCase):
+    """Test the English-to-local reverse translation indexes."""
+
+    def test_reverse_index_round_trips(self):
+        """Every local phrase appears under its English translation."""
+        for mapping, reverse in (
+            (DengueConstants.BENGALI_DENGUE_SYMPTOMS, DengueConstants.BENGALI_ENGLISH_TO_LOCAL),
+            (MalariaConstants.HINDI_SYMPTOMS, MalariaConstants.HINDI_ENGLISH_TO_LOCAL),
+        ):
+            for local, english in mapping.items():
+                self.assertIn(local, reverse[english])
+            self.assertEqual(sum(len(v) for v in reverse.values()), len(mapping))
+
+    def test_synonyms_grouped(self):
+        """Several local phrases for one symptom share a single entry."""
+        locals_ = DengueConstants.BENGALI_ENGLISH_TO_LOCAL["high fever"]
+        self.assertIsInstance(locals_, tuple)
+        self.assertGreater(len(locals_), 1)
+
+
+class TestModuleLevelConstants(unittest.TestCase):
+    """Test that the legacy classes alias the per-disease module constants."""
+
+    def test_class_attributes_alias_module_names(self):
+        """Class attributes are the very same objects as the module-level names."""
+        self.assertIs(DengueConstants.EMERGENCY_SYMPTOMS, dengue.EMERGENCY_SYMPTOMS)
+        self.assertIs(DengueConstants.SEVERITY, dengue.SEVERITY)
+        self.assertIs(DengueConstants.HINDI_DENGUE_DISCLAIMERS, dengue.HINDI_DENGUE_DISCLAIMERS)
+
+    def test_single_definition_per_namespace(self):
+        """The package re-exports the one definition in each disease module."""
+        self.assertIs(MalariaConstants, malaria.MalariaConstants)
+        self.assertIs(ResponseTemplates, templates.ResponseTemplates)
+        self.assertIs(MalariaConstants.BENGALI_SYMPTOMS, malaria.BENGALI_SYMPTOMS)
+
+
+class TestEncodedKeys(unittest.TestCase):
+    """Test the UTF-8 pre-encoded translation tables."""
+
+    def test_bytes_tables_round_trip(self):
+        """Decoding each bytes key recovers the original translation."""
+        for phrase, english in DengueConstants.encoded_phrases("hindi").items():
+            self.assertIsInstance(phrase, bytes)
+            self.assertEqual(DengueConstants.HINDI_DENGUE_SYMPTOMS[phrase.decode("utf-8")], english)
+        self.assertEqual(len(DengueConstants.encoded_phrases("bengali")),
+                         len(DengueConstants.BENGALI_DENGUE_SYMPTOMS))
+
+
+class TestInternedValues(unittest.TestCase):
+    """Test that translation values share one object per English term."""
+
+    def test_shared_english_terms_are_identical(self):
+        """The same English term from different tables is the same object."""
+        from_dengue = DengueConstants.BENGALI_DENGUE_SYMPTOMS["তীব্র জ্বর"]
+        from_malaria = next(v for v in MalariaConstants.BENGALI_SYMPTOMS.values() if v == from_dengue)
+        self.assertIs(from_dengue, from_malaria)
+        self.assertIs(from_dengue, sys.intern("high fever"))
+
+    def test_local_phrases_are_interned(self):
+        """Translation keys are interned as well."""
+        for phrase in MalariaConstants.HINDI_SYMPTOMS:
+            self.assertIs(phrase, sys.intern(phrase))
+
+
+class TestDisclaimersBySeverity(unittest.TestCase):
+    """Test the Severity-indexed disclaimer tuples."""
+
+    def test_tuples_align_with_tables(self):
+        """Each tuple slot holds the disclaimer of the matching severity name."""
+        pairs = ((DengueConstants.BENGALI_DENGUE_DISCLAIMERS,
+                  DengueConstants.BENGALI_DENGUE_DISCLAIMERS_BY_SEVERITY),
+                 (MalariaConstants.HINDI_DISCLAIMERS, MalariaConstants.HINDI_DISCLAIMERS_BY_SEVERITY))
+        for table, by_severity in pairs:
+            self.assertEqual(len(by_severity), len(Severity))
+            for level in Severity:
+                self.assertEqual(by_severity[level], table.get(level.name.lower()))
+
+    def test_missing_levels_are_none(self):
+        """Levels a table does not define are None."""
+        self.assertIsNone(MalariaConstants.DISCLAIMERS_BY_SEVERITY[Severity.WARNING])
+        self.assertIsNone(DengueConstants.HINDI_DENGUE_DISCLAIMERS_BY_SEVERITY[Severity.PREGNANCY])
+
+    def test_language_index(self):
+        """DISCLAIMERS_BY_LANGUAGE[language][severity] matches the per-language tables."""
+        tables = {Language.ENGLISH: MalariaConstants.DISCLAIMERS,
+                  Language.HINDI: MalariaConstants.HINDI_DISCLAIMERS,
+                  Language.BENGALI: MalariaConstants.BENGALI_DISCLAIMERS}
+        for language, table in tables.items():
+            for level in Severity:
+                self.assertEqual(MalariaConstants.disclaimer(language, level),
+                                 table.get(level.name.lower()))
+        self.assertEqual(language_id("bengali"), Language.BENGALI)
+        self.assertEqual(language_id("mixed"), Language.ENGLISH)
+
+    def test_script_language(self):
+        """script_language picks the dominant Indic script in one pass."""
+        self.assertEqual(script_language("তীব্র জ্বর এবং মাথাব্যথা"), "bengali")
+        self.assertEqual(script_language("तेज बुखार और सिर दर्द"), "hindi")
+        self.assertEqual(script_language("জ্বর fever बुखार और दर्द"), "hindi")
+        self.assertEqual(script_language("high fever"), "other")
+        self.assertEqual(script_language(""), "other")
+
+    def test_script_language_long_text(self):
+        """Long texts counted with NumPy classify the same as short ones."""
+        mixed = "জ্বর fever बुखार और दर्द " * 10
+        self.assertGreaterEqual(len(mixed), _VECTORIZED_SCRIPT_MIN_LENGTH)
+        self.assertEqual(script_language(mixed), "hindi")
+        self.assertEqual(script_language("তীব্র জ্বর এবং মাথাব্যথা " * 5), "bengali")
+        self.assertEqual(script_language("high fever " * 10), "other")
+        self.assertEqual(_count_scripts_vectorized(mixed),
+                         (len(_BENGALI_SCRIPT_RE.findall(mixed)),
+                          len(_DEVANAGARI_SCRIPT_RE.findall(mixed))))
+
+    def test_detect_language(self):
+        """detect_language checks one script's share of the letters."""
+        self.assertEqual(detect_language("তীব্র জ্বর", "bengali"), "bengali")
+        self.assertEqual(detect_language("तेज बुखार", "bengali"), "other")
+        self.assertEqual(detect_language("तेज बुखार", "hindi"), "hindi")
+        self.assertEqual(detect_language("103", "hindi"), "unknown")
+
+
+class TestImmutableNamespaces(unittest.TestCase):
+    """Test that constant namespaces cannot be modified at runtime."""
+
+    def test_class_attributes_are_read_only(self):
+        """Rebinding or deleting a class attribute raises AttributeError."""
+        with self.assertRaises(AttributeError):
+            DengueConstants.EMERGENCY_SYMPTOMS = frozenset()
+        with self.assertRaises(AttributeError):
+            del MalariaConstants.DISCLAIMERS
+        self.assertIn("seizure", DengueConstants.EMERGENCY_SYMPTOMS)
+
+    def test_instances_cannot_shadow_constants(self):
+        """Instances share the class constants and accept no new attributes."""
+        constants = MalariaConstants()
+        self.assertIs(constants.EMERGENCY_SYMPTOMS, MalariaConstants.EMERGENCY_SYMPTOMS)
+        with self.assertRaises(AttributeError):
+            constants.EMERGENCY_SYMPTOMS = frozenset()
+
+    def test_instances_carry_no_per_object_state(self):
+        """Every constant bundle is slot-only, so instances have no __dict__."""
+        for namespace in (DengueConstants, TuberculosisConstants, MalariaConstants,
+                          ViralFluConstants, ResponseTemplates):
+            self.assertFalse(hasattr(namespace(), "__dict__"), namespace.__name__)
+
+
+class TestCompiledAlternations(unittest.TestCase):
+    """Test the precompiled longest-first phrase alternations."""
+
+    def test_emergency_only_scan_agrees(self):
+        text = "Severe headache, তীব্র মাথাব্যথা আর খিঁচুনি; बेहोशी and high fever"
+        self.assertEqual(MalariaConstants.scan_emergency(text),
+                         MalariaConstants.scan(text)["emergency"])
+        self.assertTrue(MalariaConstants.scan_emergency(text))
+        self.assertEqual(MalariaConstants.scan_emergency(""), [])
+    
+    def test_longest_phrase_wins(self):
+        """A longer phrase is preferred over a phrase nested inside it."""
+        match = DengueConstants.pattern("bengali").search("আমার ক্রমাগত বমি হচ্ছে")
+        self.assertEqual(DengueConstants.BENGALI_DENGUE_SYMPTOMS[match.group(1)], "persistent vomiting")
+
+    def test_pattern_is_compiled_once(self):
+        """Repeated requests return the cached pattern."""
+        self.assertIs(TuberculosisConstants.pattern("hindi"), TuberculosisConstants.pattern("hindi"))
+
+    def test_malaria_emergency_pattern(self):
+        """English and local emergency phrases are both matched, ignoring case."""
+        self.assertTrue(MalariaConstants.emergency_re().search("Patient is UNCONSCIOUS"))
+        for phrase in MalariaConstants.BENGALI_ENGLISH_TO_LOCAL.get("unconscious", ()):
+            self.assertTrue(MalariaConstants.emergency_re().search(phrase))
+
+
+class TestInputNormalization(unittest.TestCase):
+    """Test that user text is normalized the same way as the table keys."""
+
+    def test_decomposed_text_still_matches(self):
+        """NFD input with irregular spacing finds the same symptoms as NFC input."""
+        text = "আমার  চোখের পেছনে ব্যথা"
+        decomposed = DengueConstants.normalize(unicodedata.normalize("NFD", text))
+        found = {DengueConstants.BENGALI_DENGUE_SYMPTOMS[phrase]
+                 for phrase in DengueConstants.candidate_phrases("bengali", len(decomposed))
+                 if phrase in decomposed}
+        self.assertIn("retro-orbital pain", found)
+
+    def test_table_keys_are_nfc(self):
+        """Translation keys are stored in NFC form."""
+        for phrase in TuberculosisConstants.HINDI_TB_SYMPTOMS:
+            self.assertEqual(unicodedata.normalize("NFC", phrase), phrase)
+
+    def test_symptom_sets_are_normalized_and_interned(self):
+        """Tier sets hold casefolded, interned terms, even if written otherwise."""
+        for symptom in MalariaConstants.EMERGENCY_SYMPTOMS | TuberculosisConstants.EARLY_SYMPTOMS:
+            self.assertEqual(normalize_symptom(symptom), symptom)
+            self.assertIs(symptom, sys.intern(symptom))
+        self.assertEqual(_intern_set({"High  Fever"}), frozenset({"high fever"}))
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that disease modules are only imported when first used."""
+
+    def test_malaria_only_import(self):
+        """Importing MalariaConstants leaves the other disease tables unbuilt."""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("import sys; from config.medical_constants import MalariaConstants; "
+                "print(sorted(m for m in sys.modules if m.startswith('config.medical_constants.')))")
+        output = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertIn("config.medical_constants.malaria", output)
+        self.assertNotIn("config.medical_constants.dengue", output)
+        self.assertNotIn("config.medical_constants.tuberculosis", output)
+
+    def test_dengue_only_import(self):
+        """Importing DengueConstants does not pull in the malaria tables."""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("import sys; from config.medical_constants import DengueConstants; "
+                "print('config.medical_constants.malaria' in sys.modules)")
+        output = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+    def test_unknown_name(self):
+        """Unknown attributes still raise AttributeError."""
+        import config.medical_constants as medical_constants
+        with self.assertRaises(AttributeError):
+            medical_constants.NotAConstant
+
+    def test_byte_tables_built_on_first_access(self):
+        """Byte-keyed tables are not encoded at import, and are cached once built."""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("from config.medical_constants import malaria; "
+                "print(malaria.MalariaConstants.encoded_phrases.cache_info().currsize)")
+        output = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "0")
+        self.assertIs(MalariaConstants.encoded_phrases("hindi"),
+                      MalariaConstants.encoded_phrases("hindi"))
+
+    def test_malaria_regexes_compiled_on_first_use(self):
+        """Importing MalariaConstants compiles neither regex; both views share one object."""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = ("from config.medical_constants import malaria; "
+                "print(malaria.symptom_re.cache_info().currsize, "
+                "malaria.emergency_re.cache_info().currsize)")
+        output = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "0 0")
+        self.assertIs(MalariaConstants.symptom_re(), malaria.symptom_re())
+        self.assertIs(MalariaConstants().emergency_re(), malaria.emergency_re())
+        with self.assertRaises(AttributeError):
+            MalariaConstants.NOT_A_PATTERN
+
+
+class TestLengthBucketedPhrases(unittest.TestCase):
+    """Length-capped candidate phrases for substring scans"""
+    
+    def test_candidates_fit_the_text(self):
+        candidates = MalariaConstants.candidate_phrases("english", 10)
+        self.assertTrue(candidates)
+        self.assertTrue(all(len(phrase) <= 10 for phrase in candidates))
+        self.assertIn("fever", candidates)
+        self.assertNotIn("difficulty breathing", candidates)
+    
+    def test_capped_scan_finds_the_same_phrases(self):
+        text = ViralFluConstants.normalize("জ্বর আর গলা ব্যথা")
+        full = {p for p in ViralFluConstants.BENGALI_FLU_SYMPTOMS if p in text}
+        capped = {p for p in ViralFluConstants.candidate_phrases("bengali", len(text)) if p in text}
+        self.assertEqual(capped, full)
+        self.assertTrue(capped)
+        self.assertEqual(ViralFluConstants.candidate_phrases("hindi", 0), ())
+
+
+class TestSinglePassScan(unittest.TestCase):
+    """One trie pass must report what the per-bucket alternations report"""
+    
+    def test_scan_matches_the_alternations(self):
+        text = "Severe headache and तेज बुखार, কাঁপুনি; recent travel, no bed net"
+        result = MalariaConstants.scan(text)
+        symptoms = [match.lower() for match in MalariaConstants.symptom_re().findall(text)]
+        self.assertEqual(result["symptoms"], [
+            MalariaConstants.HINDI_SYMPTOMS.get(s, MalariaConstants.BENGALI_SYMPTOMS.get(s, s))
+            for s in symptoms
+        ])
+        self.assertEqual(result["emergency"],
+                         [match.lower() for match in MalariaConstants.emergency_re().findall(text)])
+        self.assertEqual(result["risk"], ["recent travel", "no bed net"])
+    
+    def test_indic_table_merges_both_scripts(self):
+        hindi, bengali = MalariaConstants.HINDI_SYMPTOMS, MalariaConstants.BENGALI_SYMPTOMS
+        self.assertFalse(set(hindi) & set(bengali))
+        self.assertEqual(MalariaConstants.INDIC_SYMPTOMS, {**hindi, **bengali})
+        self.assertEqual(MalariaConstants.INDIC_SYMPTOMS["জ্বর"], "fever")
+    
+    def test_longest_phrase_wins(self):
+        self.assertEqual(MalariaConstants.scan("severe headache")["symptoms"], ["severe headache"])
+        self.assertEqual(MalariaConstants.scan(""), {"symptoms": [], "emergency": [], "risk": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
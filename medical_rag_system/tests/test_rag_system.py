@@ -73,6 +73,14 @@ class TestMedicalQueryProcessor:
         )
         assert is_emergency == False
     
+    def test_detect_emergency_intent_multiword_pattern(self, query_processor):
+        """Test severity phrases are reported as whole strings."""
+        is_emergency, emergency_indicators = query_processor.detect_emergency_intent(
+            "Severe pain and seizures, please help"
+        )
+        assert is_emergency == True
+        assert {'Severe pain', 'seizures', 'help'} <= set(emergency_indicators)
+    
     def test_classify_query_type(self, query_processor, sample_queries):
         """Test classification of different query types."""
         # Medical symptom query
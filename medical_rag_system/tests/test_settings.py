@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from config.settings import Settings
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class TestSettingsPaths:
+    """Test cases for the lazily resolved base paths."""
+
+    def test_paths_resolve_under_project_root(self):
+        """Test base paths keep their original locations and Path type."""
+        assert Settings.BASE_DIR == PROJECT_ROOT
+        assert Settings.DATA_DIR == PROJECT_ROOT / "data"
+        assert Settings.VECTOR_STORE_DIR == PROJECT_ROOT / "data" / "vector_stores"
+        assert isinstance(Settings.RAW_DATA_DIR, Path)
+        assert Settings.PROCESSED_DATA_DIR is Settings.PROCESSED_DATA_DIR
+
+    def test_paths_not_built_at_import(self):
+        """Test importing Settings for scalar values builds no paths."""
+        code = ("from config.settings import Settings; Settings.FLASK_PORT; "
+                "print('DATA_DIR' in vars(Settings))")
+        output = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "False"
+
+    def test_unknown_setting_raises(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            Settings.NOT_A_SETTING
+
+    def test_ensure_directories_creates_data_tree(self, tmp_path, monkeypatch):
+        """Test ensure_directories builds the data subdirectories and is idempotent."""
+        data_dir = tmp_path / "data"
+        for name, sub in (("RAW_DATA_DIR", "raw"), ("PROCESSED_DATA_DIR", "processed"),
+                          ("VECTOR_STORE_DIR", "vector_stores")):
+            monkeypatch.setattr(Settings, name, data_dir / sub)
+        Settings.ensure_directories()
+        Settings.ensure_directories()
+        assert sorted(p.name for p in data_dir.iterdir()) == ["processed", "raw", "vector_stores"]
+
+
+class TestSettingsServer:
+    """Test cases for the API server settings."""
+
+    def test_workers_read_web_concurrency(self):
+        """Test API_WORKERS follows WEB_CONCURRENCY when it is set."""
+        code = "from config.settings import Settings; print(Settings.API_WORKERS)"
+        env = {"WEB_CONCURRENCY": "3", "PATH": ""}
+        output = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "3"
+
+    def test_workers_default_to_one(self):
+        """Test API_WORKERS runs a single worker unless WEB_CONCURRENCY opts in."""
+        code = "from config.settings import Settings; print(Settings.API_WORKERS)"
+        output = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env={"PATH": ""},
+                                capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "1"